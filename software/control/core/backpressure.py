@@ -19,6 +19,7 @@ Ownership Model:
     After both, the primitives will be GC'd and underlying semaphores released.
 """
 
+import ctypes
 import multiprocessing
 import time
 from dataclasses import dataclass
@@ -38,11 +39,15 @@ __all__ = [
 # Conversion constant: 1 MiB = 1,048,576 bytes (binary prefix, not SI megabyte)
 _BYTES_PER_MB = 1024 * 1024
 
+# Stand-in for the raw counters once the controller is closed. Never written, so lock-free
+# reads after close() see 0 without having to check for None first.
+_CLOSED_COUNTER = ctypes.c_longlong(0)
+
 # Type alias for the backpressure values tuple: (pending_jobs, pending_bytes, capacity_event)
 BackpressureValues = Tuple[multiprocessing.Value, multiprocessing.Value, multiprocessing.Event]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BackpressureStats:
     """Current backpressure statistics for monitoring."""
 
@@ -64,12 +69,15 @@ def create_backpressure_values() -> BackpressureValues:
     2. Passed to BackpressureController at construction (main process uses them)
 
     The values are process-safe and can be shared between main process and subprocess.
+    Both counters are guarded by the same lock, so a (jobs, bytes) pair can be updated
+    or read with a single acquisition of pending_jobs.get_lock().
 
     Cleanup: The returned values don't need explicit cleanup. They're garbage collected
     when all references are dropped (after JobRunner.shutdown() and BackpressureController.close()).
     """
-    pending_jobs = multiprocessing.Value("i", 0)
-    pending_bytes = multiprocessing.Value("q", 0)
+    counter_lock = multiprocessing.RLock()
+    pending_jobs = multiprocessing.Value("i", 0, lock=counter_lock)
+    pending_bytes = multiprocessing.Value("q", 0, lock=counter_lock)
     capacity_event = multiprocessing.Event()
     return (pending_jobs, pending_bytes, capacity_event)
 
@@ -100,10 +108,26 @@ class BackpressureController:
         controller = BackpressureController(max_jobs=10, bp_values=bp_values)
 
     Thread Safety:
-        - All public methods are thread-safe (use locks on shared values)
+        - All public methods are thread-safe. Counter updates hold the lock shared by
+          both values; plain reads (get_pending_jobs/get_pending_mb) load the underlying
+          ctypes values directly, since Synchronized.value would take the lock again.
         - close() can be called from any thread and wakes threads in wait_for_capacity()
     """
 
+    def __new__(
+        cls,
+        max_jobs: int = 10,
+        max_mb: float = 500.0,
+        timeout_s: float = 30.0,
+        enabled: bool = True,
+        bp_values: Optional[BackpressureValues] = None,
+    ):
+        # A disabled controller never throttles, so hand out a subclass whose hot-path
+        # methods return immediately instead of re-checking _enabled on every call.
+        if cls is BackpressureController and not enabled:
+            cls = _DisabledBackpressureController
+        return super().__new__(cls)
+
     def __init__(
         self,
         max_jobs: int = 10,
@@ -119,14 +143,21 @@ class BackpressureController:
         self._max_bytes = int(max_mb * _BYTES_PER_MB)
         self._timeout_s = timeout_s
         self._closed = False  # Lifecycle tracking
+        # Below half of both limits, should_throttle() answers from lock-free reads
+        self._fast_path_max_jobs = max_jobs // 2
+        self._fast_path_max_bytes = self._max_bytes // 2
 
         # Use provided values or create new ones
-        if bp_values is not None:
-            self._pending_jobs, self._pending_bytes, self._capacity_event = bp_values
-        else:
-            self._pending_jobs = multiprocessing.Value("i", 0)
-            self._pending_bytes = multiprocessing.Value("q", 0)
-            self._capacity_event = multiprocessing.Event()
+        if bp_values is None:
+            bp_values = create_backpressure_values()
+        self._pending_jobs, self._pending_bytes, self._capacity_event = bp_values
+        if self._pending_jobs.get_lock() is not self._pending_bytes.get_lock():
+            raise ValueError(
+                "bp_values counters must share a single lock. Create them with create_backpressure_values()."
+            )
+        # Raw ctypes views used for lock-free reads; swapped for _CLOSED_COUNTER by close()
+        self._pending_jobs_raw = self._pending_jobs.get_obj()
+        self._pending_bytes_raw = self._pending_bytes.get_obj()
 
     @property
     def enabled(self) -> bool:
@@ -169,23 +200,27 @@ class BackpressureController:
         return self._capacity_event
 
     def get_pending_jobs(self) -> int:
-        pending_jobs = self._pending_jobs
-        if pending_jobs is None:
-            return 0
-        with pending_jobs.get_lock():
-            return pending_jobs.value
+        # Lock-free read of the underlying ctypes object. Synchronized.value would
+        # acquire the cross-process lock; a single aligned int load doesn't need it.
+        # Reads 0 after close().
+        return self._pending_jobs_raw.value
 
     def get_pending_mb(self) -> float:
-        pending_bytes = self._pending_bytes
-        if pending_bytes is None:
-            return 0.0
-        with pending_bytes.get_lock():
-            return pending_bytes.value / _BYTES_PER_MB
+        return self._pending_bytes_raw.value / _BYTES_PER_MB
 
     def should_throttle(self) -> bool:
         """Check if acquisition should wait (either limit exceeded)."""
-        if not self._enabled:
-            return False
+        return self._throttle_snapshot()[0]
+
+    def _throttle_snapshot(self) -> Tuple[bool, int, int]:
+        """Return (is_throttled, pending_jobs, pending_bytes) from at most one lock hold."""
+        # Fast path: the common case is far below both limits, where a lock-free
+        # read can't give the wrong answer. Only take the lock near the limits.
+        # After close() the raw counters read 0, so this also covers the closed state.
+        jobs = self._pending_jobs_raw.value
+        bytes_val = self._pending_bytes_raw.value
+        if jobs < self._fast_path_max_jobs and bytes_val < self._fast_path_max_bytes:
+            return False, jobs, bytes_val
 
         # Capture references to avoid race with close()
         pending_jobs = self._pending_jobs
@@ -193,30 +228,36 @@ class BackpressureController:
 
         # Guard against closed state (values set to None)
         if pending_jobs is None or pending_bytes is None:
-            return False
+            return False, 0, 0
 
+        # One acquisition covers both counters (they share a lock)
         with pending_jobs.get_lock():
-            jobs_over = pending_jobs.value >= self._max_jobs
-        with pending_bytes.get_lock():
-            bytes_over = pending_bytes.value >= self._max_bytes
+            jobs = pending_jobs.get_obj().value
+            bytes_val = pending_bytes.get_obj().value
 
-        return jobs_over or bytes_over
+        return jobs >= self._max_jobs or bytes_val >= self._max_bytes, jobs, bytes_val
 
     def wait_for_capacity(self) -> bool:
         """Wait until capacity available or timeout. Returns True if got capacity."""
         if self._warn_if_closed("wait_for_capacity"):
             return True  # Don't block on closed controller
-        if not self._enabled or not self.should_throttle():
+        throttled, jobs, bytes_val = self._throttle_snapshot()
+        if not throttled:
             return True
 
+        # Log the counters from the snapshot that triggered throttling rather than re-reading them
         log.info(
-            f"Backpressure throttling: jobs={self.get_pending_jobs()}/{self._max_jobs}, "
-            f"MB={self.get_pending_mb():.1f}/{self._max_bytes / _BYTES_PER_MB:.1f}"
+            "Backpressure throttling: jobs=%d/%d, MB=%.1f/%.1f",
+            jobs,
+            self._max_jobs,
+            bytes_val / _BYTES_PER_MB,
+            self._max_bytes / _BYTES_PER_MB,
         )
 
         deadline = time.monotonic() + self._timeout_s
         while self.should_throttle():
-            if time.monotonic() > deadline:
+            remaining_s = deadline - time.monotonic()
+            if remaining_s <= 0:
                 log.warning(f"Backpressure timeout after {self._timeout_s}s, continuing")
                 return False
             # Capture reference to avoid race with close()
@@ -225,10 +266,13 @@ class BackpressureController:
                 break  # Controller was closed
             # Clear stale signals, then re-check condition before waiting.
             # If capacity frees between clear() and wait(), should_throttle()
-            # returns False and we exit without blocking.
+            # returns False and we exit without blocking. Every path that frees
+            # capacity (job completion, reset(), close()) sets the event after
+            # updating the counters, so we can block until the deadline rather
+            # than waking up on a poll interval.
             event.clear()
             if self.should_throttle():
-                event.wait(timeout=0.1)
+                event.wait(timeout=remaining_s)
 
         log.debug("Backpressure released")
         return True
@@ -241,17 +285,14 @@ class BackpressureController:
 
         No-op if controller is disabled or closed.
         """
-        if not self._enabled:
-            return
         # Capture references to avoid race with close()
         pending_jobs = self._pending_jobs
         pending_bytes = self._pending_bytes
         if pending_jobs is None or pending_bytes is None:
             return
         with pending_jobs.get_lock():
-            pending_jobs.value += 1
-        with pending_bytes.get_lock():
-            pending_bytes.value += image_bytes
+            pending_jobs.get_obj().value += 1
+            pending_bytes.get_obj().value += image_bytes
 
     def get_stats(self) -> BackpressureStats:
         """Get atomic snapshot of backpressure state."""
@@ -269,14 +310,12 @@ class BackpressureController:
                 is_throttled=False,
             )
 
-        # Acquire both locks for atomic snapshot.
-        # Lock ordering: pending_jobs before pending_bytes (consistent throughout module)
+        # Atomic snapshot: both counters are guarded by the same lock
         with pending_jobs.get_lock():
-            jobs = pending_jobs.value
-            jobs_over = jobs >= self._max_jobs
-            with pending_bytes.get_lock():
-                bytes_val = pending_bytes.value
-                bytes_over = bytes_val >= self._max_bytes
+            jobs = pending_jobs.get_obj().value
+            bytes_val = pending_bytes.get_obj().value
+        jobs_over = jobs >= self._max_jobs
+        bytes_over = bytes_val >= self._max_bytes
 
         return BackpressureStats(
             pending_jobs=jobs,
@@ -302,21 +341,25 @@ class BackpressureController:
 
         # Check for pending jobs - warn if resetting with jobs in flight
         with pending_jobs.get_lock():
-            current_jobs = pending_jobs.value
+            current_jobs = pending_jobs.get_obj().value
             if current_jobs > 0:
                 log.warning(
                     f"Backpressure reset() called with {current_jobs} jobs pending. "
                     f"This may cause counter underflow."
                 )
-            pending_jobs.value = 0
-        with pending_bytes.get_lock():
-            pending_bytes.value = 0
+            pending_jobs.get_obj().value = 0
+            pending_bytes.get_obj().value = 0
+
+        # Wake any thread blocked in wait_for_capacity()
+        capacity_event = self._capacity_event
+        if capacity_event is not None:
+            capacity_event.set()
 
     def close(self) -> None:
         """Release references to multiprocessing resources.
 
-        Signals the capacity event to wake any threads blocked in wait_for_capacity(),
-        then clears local references to allow garbage collection.
+        Clears local references to allow garbage collection, then signals the
+        capacity event to wake any threads blocked in wait_for_capacity().
 
         Thread Safety: This method is safe to call from any thread. It captures
         references before use to avoid TOCTOU races with concurrent calls.
@@ -335,16 +378,36 @@ class BackpressureController:
         if pending_jobs is None:
             return  # Values already cleared
 
-        # Signal capacity event to wake any threads blocked in wait_for_capacity().
-        # This must happen BEFORE clearing references to prevent AttributeError
-        # when the woken thread calls should_throttle().
+        # Clear local references to allow GC. This must happen BEFORE signalling the
+        # event: a waiter woken while the old counters are still visible would see
+        # itself throttled, clear the event, and sleep out its full timeout.
+        self._pending_jobs_raw = _CLOSED_COUNTER
+        self._pending_bytes_raw = _CLOSED_COUNTER
+        self._pending_jobs = None
+        self._pending_bytes = None
+        self._capacity_event = None
+
+        # Signal the captured event to wake any threads blocked in wait_for_capacity()
         if capacity_event is not None:
             try:
                 capacity_event.set()
             except Exception as e:
                 log.debug(f"Could not set capacity event during close (may be invalid): {e}")
 
-        # Clear local references to allow GC
-        self._pending_jobs = None
-        self._pending_bytes = None
-        self._capacity_event = None
+
+class _DisabledBackpressureController(BackpressureController):
+    """BackpressureController returned for enabled=False.
+
+    Counters are still created and shared with JobRunner so get_stats() keeps
+    reporting pending work, but the per-dispatch methods skip all counter reads.
+    """
+
+    def should_throttle(self) -> bool:
+        return False
+
+    def wait_for_capacity(self) -> bool:
+        self._warn_if_closed("wait_for_capacity")
+        return True
+
+    def job_dispatched(self, image_bytes: int) -> None:
+        pass
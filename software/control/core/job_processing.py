@@ -783,8 +783,13 @@ class JobRunner(multiprocessing.Process):
         self._output_queue: multiprocessing.Queue = multiprocessing.Queue()
         self._shutdown_event: multiprocessing.Event = multiprocessing.Event()
         self._ready_event: multiprocessing.Event = multiprocessing.Event()  # Signals subprocess is ready
-        # Track jobs in flight (dispatched but not yet completed)
-        self._pending_count = multiprocessing.Value("i", 0)
+        # Track jobs in flight (dispatched but not yet completed). With backpressure enabled,
+        # this counter shares the backpressure lock so dispatch and completion update all
+        # three counters under a single acquisition.
+        if bp_pending_jobs is not None:
+            self._pending_count = multiprocessing.Value("i", 0, lock=bp_pending_jobs.get_lock())
+        else:
+            self._pending_count = multiprocessing.Value("i", 0)
 
         # Backpressure tracking (shared with BackpressureController)
         self._bp_pending_jobs = bp_pending_jobs
@@ -827,13 +832,15 @@ class JobRunner(multiprocessing.Process):
         # Increment counters BEFORE putting job in queue to prevent race condition
         # where worker processes job before counter is incremented, causing
         # has_pending() to return False while job is still in flight.
+        # Updates go through get_obj() while holding the lock: Synchronized.value
+        # would re-acquire the same lock for every read and write.
+        # _pending_count, pending_jobs and pending_bytes all share one lock when
+        # backpressure is enabled (see __init__ and create_backpressure_values).
         with self._pending_count.get_lock():
-            self._pending_count.value += 1
-        if self._bp_pending_jobs is not None:
-            with self._bp_pending_jobs.get_lock():
-                self._bp_pending_jobs.value += 1
-            with self._bp_pending_bytes.get_lock():
-                self._bp_pending_bytes.value += image_bytes
+            self._pending_count.get_obj().value += 1
+            if self._bp_pending_jobs is not None:
+                self._bp_pending_jobs.get_obj().value += 1
+                self._bp_pending_bytes.get_obj().value += image_bytes
 
         try:
             self._input_queue.put_nowait(job)
@@ -841,12 +848,15 @@ class JobRunner(multiprocessing.Process):
             # Roll back ALL counters if enqueue fails
             try:
                 with self._pending_count.get_lock():
-                    self._pending_count.value -= 1
-                if self._bp_pending_jobs is not None:
-                    with self._bp_pending_jobs.get_lock():
-                        self._bp_pending_jobs.value = max(0, self._bp_pending_jobs.value - 1)
-                    with self._bp_pending_bytes.get_lock():
-                        self._bp_pending_bytes.value = max(0, self._bp_pending_bytes.value - image_bytes)
+                    self._pending_count.get_obj().value -= 1
+                    if self._bp_pending_jobs is not None:
+                        jobs = self._bp_pending_jobs.get_obj()
+                        jobs.value = max(0, jobs.value - 1)
+                        pending_bytes = self._bp_pending_bytes.get_obj()
+                        pending_bytes.value = max(0, pending_bytes.value - image_bytes)
+                # Waiters block until signaled, so report the capacity we just released
+                if self._bp_capacity_event is not None:
+                    self._bp_capacity_event.set()
             except Exception as rollback_exc:
                 self._log.error(
                     f"Failed to rollback counters after dispatch failure: {rollback_exc}. "
@@ -859,8 +869,8 @@ class JobRunner(multiprocessing.Process):
         return self._output_queue
 
     def has_pending(self):
-        with self._pending_count.get_lock():
-            return self._pending_count.value > 0
+        # Plain read of the shared int; no need to take the lock for a snapshot.
+        return self._pending_count.get_obj().value > 0
 
     def wait_ready(self, timeout_s: float = 5.0) -> bool:
         """Wait for the subprocess to signal it's ready to process jobs.
@@ -1003,24 +1013,25 @@ class JobRunner(multiprocessing.Process):
                 set_worker_operation("")
                 # Decrement pending count when job completes (success, None result, or exception)
                 if job is not None:
-                    with self._pending_count.get_lock():
-                        self._pending_count.value -= 1
+                    image_bytes = 0
+                    if job.capture_image and job.capture_image.image_array is not None:
+                        image_bytes = job.capture_image.image_array.nbytes
 
                     # Backpressure tracking: decrement counters immediately when job completes.
-                    # Backpressure tracks queue memory, not subprocess memory.
-                    if self._bp_pending_jobs is not None:
-                        with self._bp_pending_jobs.get_lock():
-                            self._bp_pending_jobs.value = max(0, self._bp_pending_jobs.value - 1)
-
-                        # Decrement image bytes
-                        if job.capture_image and job.capture_image.image_array is not None:
-                            image_bytes = job.capture_image.image_array.nbytes
-                            with self._bp_pending_bytes.get_lock():
-                                self._bp_pending_bytes.value = max(0, self._bp_pending_bytes.value - image_bytes)
-
-                        # Signal capacity available for all job completions
-                        if self._bp_capacity_event is not None:
-                            self._bp_capacity_event.set()
+                    # Backpressure tracks queue memory, not subprocess memory. With backpressure
+                    # enabled, all counters share the lock taken here.
+                    with self._pending_count.get_lock():
+                        self._pending_count.get_obj().value -= 1
+                        if self._bp_pending_jobs is not None:
+                            jobs = self._bp_pending_jobs.get_obj()
+                            jobs.value = max(0, jobs.value - 1)
+                            if image_bytes:
+                                pending_bytes = self._bp_pending_bytes.get_obj()
+                                pending_bytes.value = max(0, pending_bytes.value - image_bytes)
+
+                    # Signal capacity available for all job completions
+                    if self._bp_capacity_event is not None:
+                        self._bp_capacity_event.set()
 
         # Finalize any zarr writers that are still open
         try:
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+import functools
 import itertools
 import math
 import re
@@ -12,6 +13,58 @@ from squid.abc import AbstractStage, AbstractCamera
 import squid.logging
 
 
+# A single well ("A1") or a well range ("A1:B12")
+_WELL_NAME_RE = re.compile(r"([A-Za-z]+)(\d+):?([A-Za-z]*)(\d*)")
+
+
+@functools.lru_cache(maxsize=4096)
+def _row_to_index(row: str) -> int:
+    """Convert a well row name ("A", "B", ..., "AA") to a 0-based row index."""
+    index = 0
+    for char in row:
+        index = index * 26 + (ord(char.upper()) - ord("A") + 1)
+    return index - 1
+
+
+@functools.lru_cache(maxsize=4096)
+def _index_to_row(index: int) -> str:
+    """Convert a 0-based row index to a well row name ("A", "B", ..., "AA")."""
+    index += 1
+    row = ""
+    while index > 0:
+        index -= 1
+        row = chr(index % 26 + ord("A")) + row
+        index //= 26
+    return row
+
+
+def _orient_s_pattern(coords: List[Tuple[float, float]], start_xy: Tuple[float, float]) -> List[Tuple[float, float]]:
+    """Re-walk an S-pattern FOV grid so it begins at the corner nearest start_xy.
+
+    The grid can be snaked from any of its four corners: rows top-down or bottom-up, with the first
+    row running left-to-right or right-to-left. Ties keep the original orientation.
+    """
+    rows = {}
+    for x, y in coords:
+        rows.setdefault(y, []).append(x)
+    row_ys = sorted(rows)
+    row_xs = [sorted(rows[y]) for y in row_ys]
+
+    best_coords, best_distance = coords, None
+    for reverse_rows in (False, True):
+        ordered = list(zip(row_ys, row_xs))
+        if reverse_rows:
+            ordered.reverse()
+        for first_row_reversed in (False, True):
+            candidate = []
+            for i, (y, xs) in enumerate(ordered):
+                candidate.extend((x, y) for x in (reversed(xs) if (i % 2 == 1) != first_row_reversed else xs))
+            distance = math.hypot(candidate[0][0] - start_xy[0], candidate[0][1] - start_xy[1])
+            if best_distance is None or distance < best_distance:
+                best_coords, best_distance = candidate, distance
+    return best_coords
+
+
 @dataclass
 class ScanCoordinatesUpdate:
     pass
@@ -93,13 +146,7 @@ class ScanCoordinates:
         self.number_of_skip = number_of_skip
 
     def _index_to_row(self, index):
-        index += 1
-        row = ""
-        while index > 0:
-            index -= 1
-            row = chr(index % 26 + ord("A")) + row
-            index //= 26
-        return row
+        return _index_to_row(int(index))
 
     def get_selected_wells(self):
         # get selected wells from the widget
@@ -148,10 +195,11 @@ class ScanCoordinates:
                 if well_id not in new_region_centers.keys():
                     self.remove_region(well_id)
 
-            # Add regions for selected wells
+            # Add regions for selected wells. The FOV size is the same for every well, so query it once.
+            fov_size_mm = self.objectiveStore.get_pixel_size_factor() * self.camera.get_fov_size_mm()
             for well_id, (x, y) in new_region_centers.items():
                 if well_id not in self.region_centers:
-                    self.add_region(well_id, x, y, scan_size_mm, overlap_percent, shape)
+                    self.add_region(well_id, x, y, scan_size_mm, overlap_percent, shape, fov_size_mm=fov_size_mm)
         else:
             self.clear_regions()
 
@@ -178,9 +226,16 @@ class ScanCoordinates:
         else:
             self._log.info("No Manual ROI found")
 
-    def add_region(self, well_id, center_x, center_y, scan_size_mm, overlap_percent=10, shape="Square"):
-        """add region based on user inputs"""
-        fov_size_mm = self.objectiveStore.get_pixel_size_factor() * self.camera.get_fov_size_mm()
+    def add_region(
+        self, well_id, center_x, center_y, scan_size_mm, overlap_percent=10, shape="Square", fov_size_mm=None
+    ):
+        """add region based on user inputs
+
+        fov_size_mm can be passed in by callers adding many regions at once; otherwise it is
+        computed from the current objective and camera.
+        """
+        if fov_size_mm is None:
+            fov_size_mm = self.objectiveStore.get_pixel_size_factor() * self.camera.get_fov_size_mm()
         step_size_mm = fov_size_mm * (1 - overlap_percent / 100)
         scan_coordinates = []
 
@@ -501,13 +556,10 @@ class ScanCoordinates:
         return inside
 
     def _is_in_circle(self, x, y, center_x, center_y, radius_squared, fov_size_mm_half):
-        corners = [
-            (x - fov_size_mm_half, y - fov_size_mm_half),
-            (x + fov_size_mm_half, y - fov_size_mm_half),
-            (x - fov_size_mm_half, y + fov_size_mm_half),
-            (x + fov_size_mm_half, y + fov_size_mm_half),
-        ]
-        return all((cx - center_x) ** 2 + (cy - center_y) ** 2 <= radius_squared for cx, cy in corners)
+        # All four FOV corners are inside the circle iff the corner farthest from the center is
+        dx = abs(x - center_x) + fov_size_mm_half
+        dy = abs(y - center_y) + fov_size_mm_half
+        return dx * dx + dy * dy <= radius_squared
 
     def has_regions(self):
         """Check if any regions exist"""
@@ -689,60 +741,55 @@ class ScanCoordinatesSiLA2(ScanCoordinates):
         if scan_size_mm is None:
             scan_size_mm = wellplate_settings["well_size_mm"]
 
+        fov_size_mm = self.camera.get_fov_size_mm()
+        previous_end = None
         for k, v in self.region_centers.items():
-            coords = self.create_region_coordinates(v[0], v[1], scan_size_mm, overlap_percent, well_shape)
+            coords = self.create_region_coordinates(
+                v[0], v[1], scan_size_mm, overlap_percent, well_shape, fov_size_mm=fov_size_mm
+            )
+            # Start each well at the grid corner closest to where the previous well's scan ended
+            if control._def.FOV_PATTERN == "S-Pattern" and previous_end is not None and coords:
+                coords = _orient_s_pattern(coords, previous_end)
+            if coords:
+                previous_end = coords[-1]
             self.region_fov_coordinates[k] = coords
 
     def get_selected_well_coordinates(self, well_names, wellplate_settings):
         """
         Given a comma separated list of well names in A1 format, return the coordinates for the wells (wrt the A1 corner)
         """
-        pattern = r"([A-Za-z]+)(\d+):?([A-Za-z]*)(\d*)"
         descriptions = well_names.split(",")
 
-        def row_to_index(row):
-            index = 0
-            for char in row:
-                index = index * 26 + (ord(char.upper()) - ord("A") + 1)
-            return index - 1
-
-        def index_to_row(index):
-            index += 1
-            row = ""
-            while index > 0:
-                index -= 1
-                row = chr(index % 26 + ord("A")) + row
-                index //= 26
-            return row
-
         for desc in descriptions:
-            match = re.match(pattern, desc.strip())
+            match = _WELL_NAME_RE.match(desc.strip())
             if match:
                 start_row, start_col, end_row, end_col = match.groups()
-                start_row_index = row_to_index(start_row)
+                start_row_index = _row_to_index(start_row)
                 start_col_index = int(start_col) - 1
 
                 if end_row and end_col:  # It's a range
-                    end_row_index = row_to_index(end_row)
+                    end_row_index = _row_to_index(end_row)
                     end_col_index = int(end_col) - 1
-                    for row in range(min(start_row_index, end_row_index), max(start_row_index, end_row_index) + 1):
-                        cols = range(min(start_col_index, end_col_index), max(start_col_index, end_col_index) + 1)
-                        # Reverse column order for alternating rows if needed
-                        if (row - start_row_index) % 2 == 1:
-                            cols = reversed(cols)
-
-                        for col in cols:
-                            x_mm = (
-                                wellplate_settings["a1_x_mm"]
-                                + col * wellplate_settings["well_spacing_mm"]
-                                + control._def.WELLPLATE_OFFSET_X_mm
-                            )
-                            y_mm = (
-                                wellplate_settings["a1_y_mm"]
-                                + row * wellplate_settings["well_spacing_mm"]
-                                + control._def.WELLPLATE_OFFSET_Y_mm
-                            )
-                            self.region_centers[index_to_row(row) + str(col + 1)] = (x_mm, y_mm)
+                    rows = np.arange(min(start_row_index, end_row_index), max(start_row_index, end_row_index) + 1)
+                    cols = np.arange(min(start_col_index, end_col_index), max(start_col_index, end_col_index) + 1)
+                    # One row of column indices per well row; reverse column order for alternating rows
+                    col_grid = np.tile(cols, (len(rows), 1))
+                    reversed_rows = (rows - start_row_index) % 2 == 1
+                    col_grid[reversed_rows] = col_grid[reversed_rows, ::-1]
+                    x_grid = (
+                        wellplate_settings["a1_x_mm"]
+                        + col_grid * wellplate_settings["well_spacing_mm"]
+                        + control._def.WELLPLATE_OFFSET_X_mm
+                    )
+                    y_mm = (
+                        wellplate_settings["a1_y_mm"]
+                        + rows * wellplate_settings["well_spacing_mm"]
+                        + control._def.WELLPLATE_OFFSET_Y_mm
+                    )
+                    for row, row_cols, row_xs, row_y in zip(rows, col_grid.tolist(), x_grid.tolist(), y_mm.tolist()):
+                        row_name = _index_to_row(int(row))
+                        for col, x_mm in zip(row_cols, row_xs):
+                            self.region_centers[row_name + str(col + 1)] = (x_mm, row_y)
                 else:
                     x_mm = (
                         wellplate_settings["a1_x_mm"]
@@ -758,8 +805,11 @@ class ScanCoordinatesSiLA2(ScanCoordinates):
             else:
                 raise ValueError(f"Invalid well format: {desc}. Expected format is 'A1' or 'A1:B2' for ranges.")
 
-    def create_region_coordinates(self, center_x, center_y, scan_size_mm, overlap_percent=10, shape="Square"):
-        fov_size_mm = self.camera.get_fov_size_mm()
+    def create_region_coordinates(
+        self, center_x, center_y, scan_size_mm, overlap_percent=10, shape="Square", fov_size_mm=None
+    ):
+        if fov_size_mm is None:
+            fov_size_mm = self.camera.get_fov_size_mm()
         # We are not taking software cropping into account here. Need to fix it when we merge this into ScanCoordinates.
         step_size_mm = fov_size_mm * (1 - overlap_percent / 100)
 
@@ -781,33 +831,26 @@ class ScanCoordinatesSiLA2(ScanCoordinates):
 
         steps = max(1, steps)  # Ensure at least one step
 
-        scan_coordinates = []
         half_steps = (steps - 1) / 2
         radius_squared = (scan_size_mm / 2) ** 2
         fov_size_mm_half = fov_size_mm / 2
 
-        def is_in_circle(x, y, center_x, center_y, radius_squared, fov_size_mm_half):
-            corners = [
-                (x - fov_size_mm_half, y - fov_size_mm_half),
-                (x + fov_size_mm_half, y - fov_size_mm_half),
-                (x - fov_size_mm_half, y + fov_size_mm_half),
-                (x + fov_size_mm_half, y + fov_size_mm_half),
-            ]
-            return all((cx - center_x) ** 2 + (cy - center_y) ** 2 <= radius_squared for cx, cy in corners)
+        # Build the whole grid at once: rows are y positions, columns are x positions
+        offsets_mm = (np.arange(steps) - half_steps) * step_size_mm
+        x_grid, y_grid = np.meshgrid(center_x + offsets_mm, center_y + offsets_mm)
+        if shape == "Circle":
+            # Keep only FOVs whose farthest corner (and so all four corners) falls inside the circle
+            far_dx = np.abs(x_grid - center_x) + fov_size_mm_half
+            far_dy = np.abs(y_grid - center_y) + fov_size_mm_half
+            mask = far_dx * far_dx + far_dy * far_dy <= radius_squared
+        else:
+            mask = np.full(x_grid.shape, shape == "Square")
 
-        for i in range(steps):
-            row = []
-            y = center_y + (i - half_steps) * step_size_mm
-            for j in range(steps):
-                x = center_x + (j - half_steps) * step_size_mm
-                if shape == "Square" or (
-                    shape == "Circle" and is_in_circle(x, y, center_x, center_y, radius_squared, fov_size_mm_half)
-                ):
-                    row.append((x, y))
+        if control._def.FOV_PATTERN == "S-Pattern":
+            x_grid[1::2] = x_grid[1::2, ::-1]
+            mask[1::2] = mask[1::2, ::-1]
 
-            if control._def.FOV_PATTERN == "S-Pattern" and i % 2 == 1:
-                row.reverse()
-            scan_coordinates.extend(row)
+        scan_coordinates = list(zip(x_grid[mask].tolist(), y_grid[mask].tolist()))
 
         if not scan_coordinates and shape == "Circle":
             scan_coordinates.append((center_x, center_y))
@@ -1,8 +1,8 @@
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Protocol
 
-import imageio
 import numpy as np
 
 import control._def
@@ -68,6 +68,10 @@ else:
     NL5 = None
 
 
+# Max frames acquire_single_fov() keeps in memory while they wait to be written to disk
+_MAX_PENDING_SAVES = 4
+
+
 def _should_simulate(global_simulated: bool, component_override: bool) -> bool:
     """Determine if a component should be simulated.
 
@@ -703,7 +707,16 @@ class Microscope:
         extension = "tiff" if image.dtype == np.uint16 else control._def.Acquisition.IMAGE_FORMAT
         p = Path(path).with_suffix(f".{extension}")
         p.parent.mkdir(parents=True, exist_ok=True)
-        imageio.imwrite(str(p), image)
+        # Writers are imported on first save so headless scripts that never save don't pay for them
+        if extension in ("tiff", "tif"):
+            import tifffile
+
+            # Write TIFFs directly with tifffile to skip imageio's per-call plugin dispatch
+            tifffile.imwrite(str(p), image, photometric="minisblack" if image.ndim == 2 else None, compression=None)
+        else:
+            import imageio
+
+            imageio.imwrite(str(p), image)
         self._log.info(f"Image saved to {p}")
         return str(p)
 
@@ -804,23 +817,34 @@ class Microscope:
             self.stage.move_z(-deltaZ * round((NZ - 1) / 2.0))
             time.sleep(control._def.SCAN_STABILIZATION_TIME_MS_Z / 1000)
 
-        saved_paths = []
+        # Images are written on a background thread so encoding/disk I/O overlaps with the
+        # next channel switch, exposure, and z move instead of stalling them.
+        # Output paths depend only on (z, channel), so build them all before touching hardware
+        file_paths = [
+            [str(Path(save_path) / f"0_0_{z_level}_{config.name.replace(' ', '_')}") for config in configs]
+            for z_level in range(NZ)
+        ]
+        save_futures: List[Future] = []
         try:
-            for z_level in range(NZ):
-                for config in configs:
-                    self.live_controller.set_microscope_mode(config)
-                    self._wait_for_microcontroller()
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="SingleFovSave") as save_executor:
+                for z_level in range(NZ):
+                    for config, file_path in zip(configs, file_paths[z_level]):
+                        self.live_controller.set_microscope_mode(config)
+                        self._wait_for_microcontroller()
+
+                        image = self.acquire_image()
 
-                    image = self.acquire_image()
+                        # Bound memory: wait for the oldest outstanding write before queueing another frame
+                        if len(save_futures) >= _MAX_PENDING_SAVES:
+                            save_futures[-_MAX_PENDING_SAVES].result()
+                        save_futures.append(save_executor.submit(self.save_image, image, file_path))
 
-                    channel_name_safe = config.name.replace(" ", "_")
-                    file_id = f"0_0_{z_level}_{channel_name_safe}"
-                    saved = self.save_image(image, str(Path(save_path) / file_id))
-                    saved_paths.append(saved)
+                    if z_level < NZ - 1:
+                        self.stage.move_z(deltaZ)
+                        time.sleep(control._def.SCAN_STABILIZATION_TIME_MS_Z / 1000)
 
-                if z_level < NZ - 1:
-                    self.stage.move_z(deltaZ)
-                    time.sleep(control._def.SCAN_STABILIZATION_TIME_MS_Z / 1000)
+                # Re-raises the first save error, if any
+                saved_paths = [future.result() for future in save_futures]
         finally:
             # Always return Z to starting position
             try:
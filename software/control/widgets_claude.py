@@ -14,7 +14,7 @@ from qtpy.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QPlainTextEdit,
+    QLineEdit,
     QPushButton,
 )
 
@@ -25,7 +25,8 @@ log = squid.logging.get_logger(__name__)
 
 CACHE_FILE = "cache/claude_api_key.yaml"
 
-_MASK_CHAR = "\u2022"  # bullet character for masking
+# The key cache is read on every GUI start; prefer libyaml's C loader when PyYAML was built with it
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def load_claude_api_key_from_cache():
@@ -38,7 +39,7 @@ def load_claude_api_key_from_cache():
         return
     try:
         with open(CACHE_FILE, "r") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_SAFE_LOADER)
         if data is None:
             return
         if not isinstance(data, dict):
@@ -65,9 +66,6 @@ class ClaudeApiKeyDialog(QDialog):
         self.setModal(True)
         self.setMinimumWidth(500)
 
-        self._stored_key = ""
-        self._is_visible = False
-
         self._setup_ui()
         self._load_key()
         self._connect_signals()
@@ -75,13 +73,12 @@ class ClaudeApiKeyDialog(QDialog):
     def _setup_ui(self):
         layout = QVBoxLayout(self)
 
-        # API key input — multi-line for long keys
+        # API key input — masked by Qt's password echo mode
         layout.addWidget(QLabel("API Key:"))
-        self.textedit_api_key = QPlainTextEdit()
-        self.textedit_api_key.setPlaceholderText("sk-ant-...")
-        self.textedit_api_key.setMaximumHeight(60)
-        self.textedit_api_key.setTabChangesFocus(True)
-        layout.addWidget(self.textedit_api_key)
+        self.lineedit_api_key = QLineEdit()
+        self.lineedit_api_key.setPlaceholderText("sk-ant-...")
+        self.lineedit_api_key.setEchoMode(QLineEdit.Password)
+        layout.addWidget(self.lineedit_api_key)
 
         # Show/hide toggle
         toggle_layout = QHBoxLayout()
@@ -124,43 +121,34 @@ class ClaudeApiKeyDialog(QDialog):
         self.btn_clear.clicked.connect(self._clear_key)
         self.btn_save.clicked.connect(self._save_key)
         self.btn_close.clicked.connect(self.close)
-        self.textedit_api_key.textChanged.connect(self._on_text_changed)
-
-    def _on_text_changed(self):
-        if self._is_visible:
-            self._stored_key = self.textedit_api_key.toPlainText().replace("\n", "").strip()
 
     def _toggle_visibility(self, show: bool):
-        self._is_visible = show
-        if show:
-            self.textedit_api_key.setReadOnly(False)
-            self.textedit_api_key.setPlainText(self._stored_key)
-            self.btn_show.setText("Hide")
-        else:
-            self._stored_key = self.textedit_api_key.toPlainText().replace("\n", "").strip()
-            self.textedit_api_key.setPlainText(_MASK_CHAR * len(self._stored_key))
-            self.textedit_api_key.setReadOnly(True)
-            self.btn_show.setText("Show")
+        self.lineedit_api_key.setEchoMode(QLineEdit.Normal if show else QLineEdit.Password)
+        self.btn_show.setText("Hide" if show else "Show")
+
+    def reset(self):
+        """Reload the stored key and clear any status from a previous session, so the dialog can be reused."""
+        self.btn_show.setChecked(False)
+        self.label_status.setText("")
+        self.label_status.setStyleSheet("color: gray;")
+        self._load_key()
 
     def _load_key(self):
-        key = control._def.ANTHROPIC_API_KEY or ""
-        self._stored_key = key
-        # Start masked and read-only
-        self.textedit_api_key.setPlainText(_MASK_CHAR * len(key))
-        self.textedit_api_key.setReadOnly(True)
+        self.lineedit_api_key.setText(control._def.ANTHROPIC_API_KEY or "")
 
     def _save_key(self):
         """Save the API key to runtime config and cache file."""
-        if self._is_visible:
-            self._stored_key = self.textedit_api_key.toPlainText().replace("\n", "").strip()
-        key = self._stored_key or None
+        key = self.lineedit_api_key.text().strip() or None
 
         data = {"api_key": key}
         try:
             os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
-            fd = os.open(CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # Write to a temp file and rename so a crash mid-write never leaves a truncated cache
+            tmp_file = CACHE_FILE + ".tmp"
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
             with os.fdopen(fd, "w") as f:
-                yaml.dump(data, f, default_flow_style=False)
+                f.write(yaml.safe_dump(data, default_flow_style=False))
+            os.replace(tmp_file, CACHE_FILE)
             control._def.ANTHROPIC_API_KEY = key
             self.label_status.setText("Saved" if key else "Cleared")
             self.label_status.setStyleSheet("color: green;")
@@ -171,6 +159,5 @@ class ClaudeApiKeyDialog(QDialog):
             log.error(f"Failed to save Anthropic API key: {e}")
 
     def _clear_key(self):
-        self._stored_key = ""
-        self.textedit_api_key.clear()
+        self.lineedit_api_key.clear()
         self._save_key()
@@ -4,13 +4,15 @@ Workflow Runner UI Components.
 Dialog and widgets for configuring and running workflow sequences.
 """
 
+import copy
+import functools
 import os
+import sys
 from typing import Optional
 
-from qtpy.QtCore import Qt, Signal
+from qtpy.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, Signal
 from qtpy.QtGui import QColor
 from qtpy.QtWidgets import (
-    QCheckBox,
     QDialog,
     QFileDialog,
     QFormLayout,
@@ -20,11 +22,10 @@ from qtpy.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
-    QTextEdit,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -34,6 +35,28 @@ from control.workflow_runner import SequenceItem, SequenceType, Workflow
 import squid.logging
 
 
+_HELP_TEXT_STYLE = "color: gray;"
+_SECTION_LABEL_STYLE = "font-weight: bold;"
+
+_FILE_DIALOG_OPTIONS = QFileDialog.DontResolveSymlinks
+if sys.platform.startswith("linux"):
+    # Qt's built-in file dialog avoids the multi-second first-open stalls of some Linux native/portal dialogs;
+    # Windows and macOS keep their native pickers
+    _FILE_DIALOG_OPTIONS |= QFileDialog.DontUseNativeDialog
+
+
+@functools.lru_cache(maxsize=16)
+def _load_workflow_cached(file_path: str, mtime_ns: int, size: int) -> Workflow:
+    """Parse a workflow file once per (path, mtime, size); a changed file gets a new key and is re-parsed."""
+    return Workflow.load_from_file(file_path)
+
+
+@functools.lru_cache(maxsize=256)
+def _basename_cached(path: str) -> str:
+    """os.path.basename for the table's command column, which the view re-reads on every repaint."""
+    return os.path.basename(path)
+
+
 def _confirm_missing_file(parent: QWidget, file_path: str, file_type: str) -> bool:
     """Ask user to confirm adding a non-existent file. Returns True if confirmed or file exists."""
     if not file_path or os.path.exists(file_path):
@@ -60,12 +83,10 @@ class AddSequenceDialog(QDialog):
                       arguments, python_path, conda_env
         """
         super().__init__(parent)
-        self._edit_mode = edit_data is not None
-        self.setWindowTitle("Edit Sequence" if self._edit_mode else "Add Sequence")
         self.setMinimumWidth(500)
+        self._last_python_dir = ""  # Kept across _reset so the browser reopens where the user last looked
         self._setup_ui()
-        if edit_data:
-            self._populate_from_data(edit_data)
+        self._reset(edit_data)
 
     def _setup_ui(self):
         layout = QFormLayout(self)
@@ -97,7 +118,7 @@ class AddSequenceDialog(QDialog):
         layout.addRow(separator)
 
         env_label = QLabel("Python Environment (choose one):")
-        env_label.setStyleSheet("font-weight: bold;")
+        env_label.setStyleSheet(_SECTION_LABEL_STYLE)
         layout.addRow(env_label)
 
         # Python executable path (optional)
@@ -121,12 +142,12 @@ class AddSequenceDialog(QDialog):
             "<small><i>Leave both empty to use Squid's Python (recommended).<br>"
             "If Conda Env is set, Python Path is ignored.</i></small>"
         )
-        help_text.setStyleSheet("color: gray;")
+        help_text.setStyleSheet(_HELP_TEXT_STYLE)
         layout.addRow(help_text)
 
         # Buttons
         btn_layout = QHBoxLayout()
-        self.btn_add = QPushButton("Save" if self._edit_mode else "Add")
+        self.btn_add = QPushButton("Add")
         self.btn_add.clicked.connect(self._validate_and_accept)
         self.btn_cancel = QPushButton("Cancel")
         self.btn_cancel.clicked.connect(self.reject)
@@ -134,6 +155,22 @@ class AddSequenceDialog(QDialog):
         btn_layout.addWidget(self.btn_cancel)
         layout.addRow(btn_layout)
 
+    def _reset(self, edit_data: dict = None):
+        """Clear the form for reuse, switching between add and edit mode and pre-populating from edit_data."""
+        self._edit_mode = edit_data is not None
+        self.setWindowTitle("Edit Sequence" if self._edit_mode else "Add Sequence")
+        self.btn_add.setText("Save" if self._edit_mode else "Add")
+        for widget in (
+            self.edit_name,
+            self.edit_script_path,
+            self.edit_arguments,
+            self.edit_python_path,
+            self.edit_conda_env,
+        ):
+            widget.clear()
+        if edit_data:
+            self._populate_from_data(edit_data)
+
     def _populate_from_data(self, data: dict):
         """Pre-populate form fields from existing data."""
         field_mapping = {
@@ -149,14 +186,22 @@ class AddSequenceDialog(QDialog):
 
     def _browse_script(self):
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Script", "", "Python Scripts (*.py);;Shell Scripts (*.sh);;All Files (*)"
+            self,
+            "Select Script",
+            "",
+            "Python Scripts (*.py);;Shell Scripts (*.sh);;All Files (*)",
+            options=_FILE_DIALOG_OPTIONS,
         )
         if file_path:
             self.edit_script_path.setText(file_path)
 
     def _browse_python(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "Select Python Executable", "/usr/bin", "All Files (*)")
+        # Start from the last pick rather than /usr/bin, which can hold thousands of entries to list
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Select Python Executable", self._last_python_dir, "All Files (*)", options=_FILE_DIALOG_OPTIONS
+        )
         if file_path:
+            self._last_python_dir = os.path.dirname(file_path)
             self.edit_python_path.setText(file_path)
 
     def _validate_and_accept(self):
@@ -201,12 +246,9 @@ class AddAcquisitionDialog(QDialog):
             edit_data: If provided, pre-populate fields for editing. Keys: name, config_path
         """
         super().__init__(parent)
-        self._edit_mode = edit_data is not None
-        self.setWindowTitle("Edit Acquisition" if self._edit_mode else "Add Acquisition")
         self.setMinimumWidth(500)
         self._setup_ui()
-        if edit_data:
-            self._populate_from_data(edit_data)
+        self._reset(edit_data)
 
     def _setup_ui(self):
         layout = QFormLayout(self)
@@ -214,7 +256,6 @@ class AddAcquisitionDialog(QDialog):
         # Name
         self.edit_name = QLineEdit()
         self.edit_name.setPlaceholderText("e.g., Acquisition, Pre-scan, Post-treatment scan")
-        self.edit_name.setText("Acquisition")
         layout.addRow("Name:", self.edit_name)
 
         # Config path with browse button
@@ -234,12 +275,12 @@ class AddAcquisitionDialog(QDialog):
             "If a YAML file is provided, acquisition settings will be<br>"
             "loaded from the file before running.</i></small>"
         )
-        help_text.setStyleSheet("color: gray;")
+        help_text.setStyleSheet(_HELP_TEXT_STYLE)
         layout.addRow(help_text)
 
         # Buttons
         btn_layout = QHBoxLayout()
-        self.btn_add = QPushButton("Save" if self._edit_mode else "Add")
+        self.btn_add = QPushButton("Add")
         self.btn_add.clicked.connect(self._validate_and_accept)
         self.btn_cancel = QPushButton("Cancel")
         self.btn_cancel.clicked.connect(self.reject)
@@ -247,6 +288,16 @@ class AddAcquisitionDialog(QDialog):
         btn_layout.addWidget(self.btn_cancel)
         layout.addRow(btn_layout)
 
+    def _reset(self, edit_data: dict = None):
+        """Clear the form for reuse, switching between add and edit mode and pre-populating from edit_data."""
+        self._edit_mode = edit_data is not None
+        self.setWindowTitle("Edit Acquisition" if self._edit_mode else "Add Acquisition")
+        self.btn_add.setText("Save" if self._edit_mode else "Add")
+        self.edit_name.setText("Acquisition")
+        self.edit_config_path.clear()
+        if edit_data:
+            self._populate_from_data(edit_data)
+
     def _populate_from_data(self, data: dict):
         """Pre-populate form fields from existing data."""
         for key, widget in [("name", self.edit_name), ("config_path", self.edit_config_path)]:
@@ -255,7 +306,11 @@ class AddAcquisitionDialog(QDialog):
 
     def _browse_config(self):
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Acquisition Config", "", "YAML Files (*.yaml *.yml);;All Files (*)"
+            self,
+            "Select Acquisition Config",
+            "",
+            "YAML Files (*.yaml *.yml);;All Files (*)",
+            options=_FILE_DIALOG_OPTIONS,
         )
         if file_path:
             self.edit_config_path.setText(file_path)
@@ -276,6 +331,154 @@ class AddAcquisitionDialog(QDialog):
         }
 
 
+class WorkflowTableModel(QAbstractTableModel):
+    """Table model backed directly by a Workflow's sequences, so table edits write through to the SequenceItems."""
+
+    # Column indices
+    COL_INCLUDE = 0
+    COL_NAME = 1
+    COL_COMMAND = 2
+    COL_CYCLE_ARG = 3
+    COL_CYCLE_VALUES = 4
+    HEADERS = ["Include", "Name", "Command/Path", "Cycle Arg", "Cycle Arg Values"]
+
+    # Row colors, shared by every cell instead of constructed per cell
+    COLOR_ACQUISITION_BG = QColor(240, 240, 255)  # Light blue
+    COLOR_ACQUISITION_FG = QColor(128, 128, 128)  # Gray text
+    COLOR_RUNNING_BG = QColor(200, 255, 200)  # Light green
+
+    def __init__(self, workflow: Workflow, parent=None):
+        super().__init__(parent)
+        self._workflow = workflow
+        self._current_row = -1
+        self._editable = True  # Disabled while the workflow runs
+
+    def set_workflow(self, workflow: Workflow):
+        """Replace the backing workflow, e.g. after loading a file."""
+        self.beginResetModel()
+        self._workflow = workflow
+        self._current_row = -1
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._workflow.sequences)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        seq = self._workflow.sequences[index.row()]
+        col = index.column()
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if col == self.COL_NAME:
+                return seq.name
+            if col == self.COL_COMMAND:
+                return self._command_text(seq)
+            if col == self.COL_CYCLE_ARG:
+                return seq.cycle_arg_name or ""
+            if col == self.COL_CYCLE_VALUES:
+                return seq.cycle_arg_values or ""
+            return None
+        if role == Qt.CheckStateRole and col == self.COL_INCLUDE:
+            return Qt.Checked if seq.included else Qt.Unchecked
+        if role == Qt.BackgroundRole:
+            if index.row() == self._current_row:
+                return self.COLOR_RUNNING_BG
+            if seq.is_acquisition():
+                return self.COLOR_ACQUISITION_BG
+            return None
+        if role == Qt.ForegroundRole and seq.is_acquisition() and col > self.COL_NAME:
+            return self.COLOR_ACQUISITION_FG
+        return None
+
+    @staticmethod
+    def _command_text(seq: SequenceItem) -> str:
+        """Text for the command column of a sequence."""
+        if seq.is_acquisition():
+            if seq.config_path:
+                return f"Config: {_basename_cached(seq.config_path)}"
+            return "(Current Settings)"
+
+        cmd_text = seq.script_path or ""
+        if seq.arguments:
+            cmd_text += f" {seq.arguments}"
+        if seq.conda_env:
+            cmd_text = f"[{seq.conda_env}] {cmd_text}"
+        elif seq.python_path:
+            cmd_text = f"[{_basename_cached(seq.python_path)}] {cmd_text}"
+        return cmd_text
+
+    def flags(self, index):
+        base_flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if not index.isValid() or not self._editable:
+            return base_flags
+        if index.column() == self.COL_INCLUDE:
+            return base_flags | Qt.ItemIsUserCheckable
+        # Acquisition rows are edited through the dialog only; the command column is built from several fields
+        if self._workflow.sequences[index.row()].is_acquisition():
+            return base_flags
+        if index.column() in (self.COL_NAME, self.COL_CYCLE_ARG, self.COL_CYCLE_VALUES):
+            return base_flags | Qt.ItemIsEditable
+        return base_flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or not (self.flags(index) & (Qt.ItemIsEditable | Qt.ItemIsUserCheckable)):
+            return False
+        seq = self._workflow.sequences[index.row()]
+        col = index.column()
+
+        if role == Qt.CheckStateRole and col == self.COL_INCLUDE:
+            # PyQt5 passes an int, PyQt6 may pass a CheckState enum - compare underlying values
+            seq.included = getattr(value, "value", value) == getattr(Qt.Checked, "value", Qt.Checked)
+        elif role == Qt.EditRole and col == self.COL_NAME:
+            name = str(value).strip()
+            # Name is required and "Acquisition" is reserved
+            if not name or name.lower() == "acquisition":
+                return False
+            seq.name = name
+        elif role == Qt.EditRole and col == self.COL_CYCLE_ARG:
+            seq.cycle_arg_name = str(value).strip() or None
+        elif role == Qt.EditRole and col == self.COL_CYCLE_VALUES:
+            seq.cycle_arg_values = str(value).strip() or None
+        else:
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+
+    def set_editable(self, editable: bool):
+        """Enable or disable editing of the table."""
+        self._editable = editable
+
+    def insert_sequence(self, row: int, seq: SequenceItem):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._workflow.sequences.insert(row, seq)
+        self.endInsertRows()
+
+    def remove_sequence(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._workflow.sequences[row]
+        self.endRemoveRows()
+
+    def sequence_changed(self, row: int):
+        """Notify views that the sequence at row was modified outside the model."""
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def set_current_row(self, row: int):
+        """Highlight row as the running sequence; -1 clears the highlight."""
+        previous, self._current_row = self._current_row, row
+        for r in (previous, row):
+            if 0 <= r < self.rowCount():
+                self.dataChanged.emit(self.index(r, 0), self.index(r, self.columnCount() - 1), [Qt.BackgroundRole])
+
+
 class WorkflowRunnerDialog(QDialog):
     """Dialog for configuring and running workflow sequences."""
 
@@ -284,12 +487,13 @@ class WorkflowRunnerDialog(QDialog):
     signal_resume_workflow = Signal()  # Emitted when Resume is clicked
     signal_stop_workflow = Signal()  # Emitted when Stop is clicked
 
-    # Column indices
-    COL_INCLUDE = 0
-    COL_NAME = 1
-    COL_COMMAND = 2
-    COL_CYCLE_ARG = 3
-    COL_CYCLE_VALUES = 4
+    # Oldest log lines are dropped past this count so long runs don't grow the log document without bound
+    MAX_LOG_LINES = 10000
+    # Script output is buffered and appended at most once per interval instead of once per line
+    LOG_FLUSH_INTERVAL_MS = 40
+
+    # Status colors are selected through a dynamic property against one stylesheet parsed at setup
+    STATUS_COLORS = ("black", "blue", "green", "orange", "red")
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -297,8 +501,10 @@ class WorkflowRunnerDialog(QDialog):
         self._workflow = Workflow.create_default()
         self._is_running = False
         self._is_paused = False
+        # Add/edit dialogs are built on first use and reset for each later use
+        self._sequence_dialog: Optional[AddSequenceDialog] = None
+        self._acquisition_dialog: Optional[AddAcquisitionDialog] = None
         self._setup_ui()
-        self._load_workflow_to_table()
 
     def _setup_ui(self):
         self.setWindowTitle("Workflow Runner")
@@ -314,9 +520,11 @@ class WorkflowRunnerDialog(QDialog):
         layout.addWidget(info_label)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self._model = WorkflowTableModel(self._workflow, self)
+        self.table = QTableView()
+        self.table.setModel(self._model)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
         self.table.horizontalHeader().setStretchLastSection(True)
         self._setup_table_columns()
         layout.addWidget(self.table)
@@ -338,11 +546,11 @@ class WorkflowRunnerDialog(QDialog):
         btn_layout = QHBoxLayout()
 
         self.btn_insert_above = QPushButton("Insert Above")
-        self.btn_insert_above.clicked.connect(lambda: self._insert_sequence(above=True))
+        self.btn_insert_above.clicked.connect(self._insert_above)
         btn_layout.addWidget(self.btn_insert_above)
 
         self.btn_insert_below = QPushButton("Insert Below")
-        self.btn_insert_below.clicked.connect(lambda: self._insert_sequence(above=False))
+        self.btn_insert_below.clicked.connect(self._insert_below)
         btn_layout.addWidget(self.btn_insert_below)
 
         self.btn_edit = QPushButton("Edit")
@@ -380,8 +588,24 @@ class WorkflowRunnerDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
+        # Controls disabled while a workflow runs
+        self._editing_widgets = (
+            self.btn_run,
+            self.btn_insert_above,
+            self.btn_insert_below,
+            self.btn_edit,
+            self.btn_remove,
+            self.btn_save,
+            self.btn_load,
+            self.spinbox_cycles,
+        )
+
         # Status label
         self.label_status = QLabel("")
+        self.label_status.setStyleSheet(
+            " ".join(f'QLabel[statusColor="{color}"] {{ color: {color}; }}' for color in self.STATUS_COLORS)
+        )
+        self._status_color = None
         layout.addWidget(self.label_status)
 
         # Script output area
@@ -394,103 +618,31 @@ class WorkflowRunnerDialog(QDialog):
         output_header_layout.addWidget(self.btn_save_log)
         layout.addLayout(output_header_layout)
 
-        self.text_output = QTextEdit()
+        self.text_output = QPlainTextEdit()
         self.text_output.setReadOnly(True)
+        self.text_output.setUndoRedoEnabled(False)
+        self.text_output.setMaximumBlockCount(self.MAX_LOG_LINES)
         self.text_output.setMaximumHeight(150)
         self.text_output.setStyleSheet("font-family: monospace; font-size: 10pt;")
         layout.addWidget(self.text_output)
 
+        self._pending_output = []
+        self._output_flush_timer = QTimer(self)
+        self._output_flush_timer.setSingleShot(True)
+        self._output_flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._output_flush_timer.timeout.connect(self._flush_output)
+
     def _setup_table_columns(self):
-        """Configure table columns."""
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Include", "Name", "Command/Path", "Cycle Arg", "Cycle Arg Values"])
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)  # Command column stretches
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
+        """Configure table column sizing; headers come from the model."""
+        # Size every column to its contents, then let the command column take the remaining width
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(WorkflowTableModel.COL_COMMAND, QHeaderView.Stretch)
 
     def _on_cycles_changed(self, value):
         """Handle cycles spinbox value change."""
         self._workflow.num_cycles = value
 
-    def _load_workflow_to_table(self):
-        """Populate table from workflow data."""
-        self.table.setRowCount(len(self._workflow.sequences))
-
-        for row, seq in enumerate(self._workflow.sequences):
-            self._populate_table_row(row, seq)
-
-    def _populate_table_row(self, row: int, seq: SequenceItem):
-        """Populate a single table row with sequence data."""
-        is_acq = seq.is_acquisition()
-
-        # Include checkbox
-        checkbox = QCheckBox()
-        checkbox.setChecked(seq.included)
-        checkbox.toggled.connect(lambda checked, r=row: self._on_include_toggled(r, checked))
-        cell_widget = QWidget()
-        cell_layout = QHBoxLayout(cell_widget)
-        cell_layout.addWidget(checkbox)
-        cell_layout.setAlignment(Qt.AlignCenter)
-        cell_layout.setContentsMargins(0, 0, 0, 0)
-        self.table.setCellWidget(row, self.COL_INCLUDE, cell_widget)
-
-        # Name
-        name_item = QTableWidgetItem(seq.name)
-        self._apply_acquisition_styling(name_item, is_acq)
-        self.table.setItem(row, self.COL_NAME, name_item)
-
-        # Command
-        cmd_item = self._create_command_item(seq)
-        self.table.setItem(row, self.COL_COMMAND, cmd_item)
-
-        # Cycle Arg name
-        cycle_arg_item = QTableWidgetItem(seq.cycle_arg_name or "")
-        self._apply_acquisition_styling(cycle_arg_item, is_acq, include_foreground=True)
-        self.table.setItem(row, self.COL_CYCLE_ARG, cycle_arg_item)
-
-        # Cycle Values
-        cycle_values_item = QTableWidgetItem(seq.cycle_arg_values or "")
-        self._apply_acquisition_styling(cycle_values_item, is_acq, include_foreground=True)
-        self.table.setItem(row, self.COL_CYCLE_VALUES, cycle_values_item)
-
-    def _create_command_item(self, seq: SequenceItem) -> QTableWidgetItem:
-        """Create the command column item for a sequence."""
-        if seq.is_acquisition():
-            if seq.config_path:
-                cmd_text = f"Config: {os.path.basename(seq.config_path)}"
-            else:
-                cmd_text = "(Current Settings)"
-            item = QTableWidgetItem(cmd_text)
-            self._apply_acquisition_styling(item, is_acquisition=True, include_foreground=True)
-            return item
-
-        cmd_text = seq.script_path or ""
-        if seq.arguments:
-            cmd_text += f" {seq.arguments}"
-        if seq.conda_env:
-            cmd_text = f"[{seq.conda_env}] {cmd_text}"
-        elif seq.python_path:
-            cmd_text = f"[{os.path.basename(seq.python_path)}] {cmd_text}"
-        return QTableWidgetItem(cmd_text)
-
-    def _apply_acquisition_styling(
-        self, item: QTableWidgetItem, is_acquisition: bool, include_foreground: bool = False
-    ):
-        """Apply read-only styling for acquisition sequence items."""
-        if not is_acquisition:
-            return
-        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-        item.setBackground(QColor(240, 240, 255))  # Light blue
-        if include_foreground:
-            item.setForeground(QColor(128, 128, 128))  # Gray text
-
-    def _on_include_toggled(self, row: int, checked: bool):
-        """Handle include checkbox toggle."""
-        if row < len(self._workflow.sequences):
-            self._workflow.sequences[row].included = checked
-
     def _prompt_sequence_type(self) -> Optional[str]:
         """Prompt user to choose between script and acquisition. Returns 'script', 'acquisition', or None."""
         msg_box = QMessageBox(self)
@@ -508,10 +660,24 @@ class WorkflowRunnerDialog(QDialog):
             return "acquisition"
         return None
 
+    def _get_sequence_dialog(self, is_acquisition: bool, edit_data: dict = None) -> QDialog:
+        """Return the shared add/edit dialog for the sequence type, reset for this use."""
+        if is_acquisition:
+            if self._acquisition_dialog is None:
+                self._acquisition_dialog = AddAcquisitionDialog(self, edit_data=edit_data)
+            else:
+                self._acquisition_dialog._reset(edit_data)
+            return self._acquisition_dialog
+        if self._sequence_dialog is None:
+            self._sequence_dialog = AddSequenceDialog(self, edit_data=edit_data)
+        else:
+            self._sequence_dialog._reset(edit_data)
+        return self._sequence_dialog
+
     def _create_sequence_from_dialog(self, sequence_type: str) -> Optional[SequenceItem]:
         """Show dialog and create SequenceItem. Returns None if cancelled."""
         if sequence_type == "acquisition":
-            dialog = AddAcquisitionDialog(self)
+            dialog = self._get_sequence_dialog(is_acquisition=True)
             if dialog.exec_() != QDialog.Accepted:
                 return None
             seq_data = dialog.get_sequence_data()
@@ -522,7 +688,7 @@ class WorkflowRunnerDialog(QDialog):
                 included=True,
             )
         else:
-            dialog = AddSequenceDialog(self)
+            dialog = self._get_sequence_dialog(is_acquisition=False)
             if dialog.exec_() != QDialog.Accepted:
                 return None
             seq_data = dialog.get_sequence_data()
@@ -536,6 +702,12 @@ class WorkflowRunnerDialog(QDialog):
                 included=True,
             )
 
+    def _insert_above(self):
+        self._insert_sequence(above=True)
+
+    def _insert_below(self):
+        self._insert_sequence(above=False)
+
     def _insert_sequence(self, above: bool, sequence_type: str = None):
         """Insert a new sequence above or below current selection."""
         if sequence_type is None:
@@ -547,29 +719,29 @@ class WorkflowRunnerDialog(QDialog):
         if new_seq is None:
             return
 
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row < 0:
             insert_idx = 0 if above else len(self._workflow.sequences)
         else:
             insert_idx = current_row if above else current_row + 1
 
-        self._workflow.sequences.insert(insert_idx, new_seq)
-        self._load_workflow_to_table()
+        self._model.insert_sequence(insert_idx, new_seq)
         self.table.selectRow(insert_idx)
         self.label_status.setText(f"Added sequence '{new_seq.name}'")
 
     def _edit_sequence(self):
         """Edit the selected sequence."""
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row < 0:
             QMessageBox.information(self, "No Selection", "Please select a sequence to edit.")
             return
 
         seq = self._workflow.sequences[current_row]
+        is_acquisition = seq.is_acquisition()
 
-        if seq.is_acquisition():
+        if is_acquisition:
             edit_data = {"name": seq.name, "config_path": seq.config_path}
-            dialog = AddAcquisitionDialog(self, edit_data=edit_data)
+            dialog = self._get_sequence_dialog(is_acquisition=True, edit_data=edit_data)
         else:
             edit_data = {
                 "name": seq.name,
@@ -578,14 +750,14 @@ class WorkflowRunnerDialog(QDialog):
                 "python_path": seq.python_path,
                 "conda_env": seq.conda_env,
             }
-            dialog = AddSequenceDialog(self, edit_data=edit_data)
+            dialog = self._get_sequence_dialog(is_acquisition=False, edit_data=edit_data)
 
         if dialog.exec_() != QDialog.Accepted:
             return
 
         seq_data = dialog.get_sequence_data()
         seq.name = seq_data["name"]
-        if seq.is_acquisition():
+        if is_acquisition:
             seq.config_path = seq_data["config_path"]
         else:
             seq.script_path = seq_data["script_path"]
@@ -593,13 +765,13 @@ class WorkflowRunnerDialog(QDialog):
             seq.python_path = seq_data["python_path"]
             seq.conda_env = seq_data["conda_env"]
 
-        self._load_workflow_to_table()
+        self._model.sequence_changed(current_row)
         self.table.selectRow(current_row)
         self.label_status.setText("Changes saved")
 
     def _remove_sequence(self):
         """Remove selected sequence."""
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row < 0:
             QMessageBox.information(self, "No Selection", "Please select a sequence to remove.")
             return
@@ -611,15 +783,14 @@ class WorkflowRunnerDialog(QDialog):
             self, "Confirm Remove", f"Remove {seq_type} '{seq.name}'?", QMessageBox.Yes | QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            del self._workflow.sequences[current_row]
-            self._load_workflow_to_table()
+            self._model.remove_sequence(current_row)
             self.label_status.setText(f"Removed {seq_type} '{seq.name}'")
 
     def _save_workflow(self):
         """Save workflow to YAML file."""
-        self._sync_table_to_workflow()
-
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save Workflow", "", "YAML Files (*.yaml *.yml)")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Workflow", "", "YAML Files (*.yaml *.yml)", options=_FILE_DIALOG_OPTIONS
+        )
         if not file_path:
             return
         if not file_path.endswith((".yaml", ".yml")):
@@ -634,14 +805,18 @@ class WorkflowRunnerDialog(QDialog):
 
     def _load_workflow(self):
         """Load workflow from YAML file."""
-        file_path, _ = QFileDialog.getOpenFileName(self, "Load Workflow", "", "YAML Files (*.yaml *.yml)")
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Load Workflow", "", "YAML Files (*.yaml *.yml)", options=_FILE_DIALOG_OPTIONS
+        )
         if not file_path:
             return
 
         try:
-            self._workflow = Workflow.load_from_file(file_path)
+            st = os.stat(file_path)
+            # Copy so table edits never mutate the cached instance
+            self._workflow = copy.deepcopy(_load_workflow_cached(file_path, st.st_mtime_ns, st.st_size))
             self.spinbox_cycles.setValue(self._workflow.num_cycles)
-            self._load_workflow_to_table()
+            self._model.set_workflow(self._workflow)
             self._set_status(f"Loaded {os.path.basename(file_path)}", "green")
         except Exception as e:
             QMessageBox.critical(self, "Load Error", f"Failed to load workflow: {e}")
@@ -649,8 +824,6 @@ class WorkflowRunnerDialog(QDialog):
 
     def _run_workflow(self):
         """Validate and emit signal to run workflow."""
-        self._sync_table_to_workflow()
-
         # Validate cycle args if any sequence has them
         errors = self._workflow.validate_cycle_args()
         if errors:
@@ -694,53 +867,9 @@ class WorkflowRunnerDialog(QDialog):
         self._log.info("Stopping workflow")
         self.signal_stop_workflow.emit()
 
-    def _get_table_text(self, row: int, col: int) -> Optional[str]:
-        """Get text from table cell, or None if empty."""
-        item = self.table.item(row, col)
-        return item.text().strip() or None if item else None
-
-    def _sync_table_to_workflow(self):
-        """Sync table edits back to workflow data."""
-        self._workflow.num_cycles = self.spinbox_cycles.value()
-
-        for row, seq in enumerate(self._workflow.sequences):
-            # Get include state from checkbox
-            cell_widget = self.table.cellWidget(row, self.COL_INCLUDE)
-            if cell_widget:
-                checkbox = cell_widget.findChild(QCheckBox)
-                if checkbox:
-                    seq.included = checkbox.isChecked()
-
-            # Skip Acquisition - it's not editable via table
-            if seq.is_acquisition():
-                continue
-
-            # Update name (but not to "acquisition")
-            new_name = self._get_table_text(row, self.COL_NAME)
-            if new_name and new_name.lower() != "acquisition":
-                seq.name = new_name
-
-            # Cycle args
-            seq.cycle_arg_name = self._get_table_text(row, self.COL_CYCLE_ARG)
-            seq.cycle_arg_values = self._get_table_text(row, self.COL_CYCLE_VALUES)
-
     def highlight_sequence(self, index: int):
         """Highlight the currently running sequence."""
-        for row in range(self.table.rowCount()):
-            background = self._get_row_background_color(row, is_running=(row == index))
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item:
-                    item.setBackground(background)
-
-    def _get_row_background_color(self, row: int, is_running: bool = False) -> QColor:
-        """Get the appropriate background color for a table row."""
-        if is_running:
-            return QColor(200, 255, 200)  # Light green for running
-        seq = self._workflow.sequences[row] if row < len(self._workflow.sequences) else None
-        if seq and seq.is_acquisition():
-            return QColor(240, 240, 255)  # Light blue for acquisition
-        return QColor(255, 255, 255)  # White for scripts
+        self._model.set_current_row(index)
 
     def clear_highlight(self):
         """Clear all row highlights."""
@@ -749,35 +878,44 @@ class WorkflowRunnerDialog(QDialog):
     def _set_status(self, text: str, color: str = "black"):
         """Set status label text and color."""
         self.label_status.setText(text)
-        self.label_status.setStyleSheet(f"color: {color};")
+        # Switching the property only re-polishes the label; the stylesheet itself is never re-parsed
+        if color != self._status_color:
+            self._status_color = color
+            self.label_status.setProperty("statusColor", color)
+            style = self.label_status.style()
+            style.unpolish(self.label_status)
+            style.polish(self.label_status)
 
     def set_running_state(self, running: bool):
         """Update UI based on running state."""
+        if running == self._is_running:
+            return
         self._is_running = running
         self._is_paused = False
 
-        # Enable/disable editing controls (inverse of running state)
-        for widget in [
-            self.btn_run,
-            self.btn_insert_above,
-            self.btn_insert_below,
-            self.btn_edit,
-            self.btn_remove,
-            self.btn_save,
-            self.btn_load,
-            self.spinbox_cycles,
-        ]:
-            widget.setEnabled(not running)
-
-        # Pause and Stop buttons enabled when running
-        self.btn_pause.setEnabled(running)
-        self.btn_stop.setEnabled(running)
-        self.btn_pause.setText("Pause")
+        # Repaint once after all buttons are toggled rather than once per button
+        self.setUpdatesEnabled(False)
+        try:
+            # Enable/disable editing controls (inverse of running state)
+            for widget in self._editing_widgets:
+                widget.setEnabled(not running)
+            # The runner executes this same Workflow object, so freeze in-table edits while it runs
+            self._model.set_editable(not running)
+
+            # Pause and Stop buttons enabled when running
+            self.btn_pause.setEnabled(running)
+            self.btn_stop.setEnabled(running)
+            self.btn_pause.setText("Pause")
+        finally:
+            self.setUpdatesEnabled(True)
 
         if running:
             self._set_status("Workflow running...", "blue")
+            self._pending_output.clear()
             self.text_output.clear()
         else:
+            # Show the final lines of output now rather than on the next timer tick
+            self._flush_output()
             self.clear_highlight()
             if "Running:" in self.label_status.text():
                 self._set_status("Ready")
@@ -812,8 +950,18 @@ class WorkflowRunnerDialog(QDialog):
         self._set_status(f"Error: {error_msg}", "red")
 
     def on_script_output(self, line: str):
-        """Append script output line."""
-        self.text_output.append(line)
+        """Queue a script output line; buffered lines are appended together on the next flush."""
+        self._pending_output.append(line)
+        if not self._output_flush_timer.isActive():
+            self._output_flush_timer.start()
+
+    def _flush_output(self):
+        """Append all buffered script output lines in one document update."""
+        self._output_flush_timer.stop()
+        if not self._pending_output:
+            return
+        self.text_output.appendPlainText("\n".join(self._pending_output))
+        self._pending_output.clear()
         # Auto-scroll to bottom
         scrollbar = self.text_output.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
@@ -823,10 +971,13 @@ class WorkflowRunnerDialog(QDialog):
         from datetime import datetime
 
         default_name = f"workflow_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save Log", default_name, "Text Files (*.txt);;All Files (*)")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Log", default_name, "Text Files (*.txt);;All Files (*)", options=_FILE_DIALOG_OPTIONS
+        )
         if not file_path:
             return
 
+        self._flush_output()
         try:
             with open(file_path, "w") as f:
                 f.write(self.text_output.toPlainText())
@@ -837,6 +988,7 @@ class WorkflowRunnerDialog(QDialog):
 
     def closeEvent(self, event):
         """Handle dialog close - warn if workflow is running."""
+        self._flush_output()
         if self._is_running:
             reply = QMessageBox.question(
                 self,
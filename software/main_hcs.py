@@ -235,9 +235,15 @@ if __name__ == "__main__":
             settings_menu.addAction(python_exec_action)
 
             # Add Set Anthropic API Key action
+            # Created on first use and reused afterwards; reset() reloads the key each time it is opened
+            win.apiKeyDialog = None
+
             def open_api_key_dialog():
-                dialog = ClaudeApiKeyDialog(parent=win)
-                dialog.exec_()
+                if win.apiKeyDialog is None:
+                    win.apiKeyDialog = ClaudeApiKeyDialog(parent=win)
+                else:
+                    win.apiKeyDialog.reset()
+                win.apiKeyDialog.exec_()
 
             api_key_action = QAction("Set Anthropic API Key...", win)
             api_key_action.setToolTip("Set the API key used when launching Claude Code")
@@ -7,7 +7,7 @@ preventing RAM exhaustion when acquisition speed exceeds disk write speed.
 import logging
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError, dataclass
 
 import numpy as np
 import pytest
@@ -128,6 +128,26 @@ class TestBackpressureController:
 
         assert controller.should_throttle() is False
 
+    def test_disabled_controller_still_reports_stats(self):
+        """Disabled controller skips throttling but keeps the shared counters for monitoring."""
+        controller = BackpressureController(max_jobs=1, max_mb=0.001, enabled=False)
+
+        assert isinstance(controller, BackpressureController)
+        assert controller.enabled is False
+
+        # JobRunner still updates the shared counters directly
+        with controller._pending_jobs.get_lock():
+            controller._pending_jobs.value = 3
+
+        # job_dispatched() is a no-op when disabled
+        controller.job_dispatched(1000)
+
+        stats = controller.get_stats()
+        assert stats.pending_jobs == 3
+        assert stats.is_throttled is False
+
+        controller.close()
+
     def test_throttle_triggers_at_job_limit(self):
         """Throttling triggers when job count reaches limit."""
         controller = BackpressureController(max_jobs=5, max_mb=1000.0)
@@ -178,6 +198,17 @@ class TestBackpressureController:
         assert stats.max_pending_mb == 500.0
         assert stats.is_throttled is False
 
+    def test_stats_snapshot_is_immutable(self):
+        """BackpressureStats is a frozen, slotted snapshot."""
+        controller = BackpressureController(max_jobs=10, max_mb=500.0)
+        stats = controller.get_stats()
+
+        assert not hasattr(stats, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            stats.pending_jobs = 5
+
+        controller.close()
+
     def test_reset_clears_counters(self):
         """reset() clears all pending counters."""
         controller = BackpressureController(max_jobs=10, max_mb=500.0)
@@ -232,6 +263,19 @@ class TestBackpressureController:
         assert result is False
         assert 0.2 < elapsed < 0.5  # Should timeout around 0.3s
 
+    def test_wait_for_capacity_logs_triggering_snapshot(self, caplog):
+        """wait_for_capacity() logs the counters that caused throttling."""
+        controller = BackpressureController(max_jobs=2, max_mb=500.0, timeout_s=0.05)
+        controller.job_dispatched(1024 * 1024)
+        controller.job_dispatched(1024 * 1024)
+
+        with caplog.at_level(logging.INFO):
+            controller.wait_for_capacity()
+
+        assert "Backpressure throttling: jobs=2/2, MB=2.0/500.0" in caplog.text
+
+        controller.close()
+
     def test_wait_for_capacity_releases_when_capacity_available(self):
         """wait_for_capacity() returns when job completes and signals event."""
         controller = BackpressureController(max_jobs=2, max_mb=500.0, timeout_s=5.0)
@@ -264,6 +308,27 @@ class TestBackpressureController:
         assert result is True
         assert elapsed < 1.0  # Should release quickly after job completion
 
+    def test_reset_wakes_blocked_wait_for_capacity(self):
+        """reset() signals the capacity event so waiters don't sit until the timeout."""
+        controller = BackpressureController(max_jobs=1, max_mb=500.0, timeout_s=30.0)
+        controller.job_dispatched(1000)
+        controller.job_dispatched(1000)
+
+        result = [None]
+
+        def wait_worker():
+            result[0] = controller.wait_for_capacity()
+
+        thread = threading.Thread(target=wait_worker)
+        thread.start()
+        time.sleep(0.2)  # Let thread start waiting
+        controller.reset()
+        thread.join(timeout=2.0)
+
+        assert not thread.is_alive(), "Thread should have been woken by reset()"
+        assert result[0] is True
+        controller.close()
+
     def test_close_releases_resources(self):
         """close() releases multiprocessing resources to avoid semaphore leaks."""
         controller = BackpressureController(max_jobs=10, max_mb=500.0)
@@ -339,6 +404,21 @@ class TestBackpressureController:
 
         controller.close()
 
+    def test_create_backpressure_values_share_one_lock(self):
+        """Both counters are guarded by a single lock so one acquisition covers them."""
+        jobs, bytes_, _ = create_backpressure_values()
+
+        assert jobs.get_lock() is bytes_.get_lock()
+
+    def test_constructor_rejects_values_with_separate_locks(self):
+        """bp_values whose counters have independent locks are rejected."""
+        import multiprocessing
+
+        bp_values = (multiprocessing.Value("i", 0), multiprocessing.Value("q", 0), multiprocessing.Event())
+
+        with pytest.raises(ValueError):
+            BackpressureController(max_jobs=10, max_mb=500.0, bp_values=bp_values)
+
     def test_should_throttle_on_closed_controller_returns_false(self):
         """should_throttle() returns False on closed controller."""
         controller = BackpressureController(max_jobs=1, max_mb=0.001)
@@ -457,6 +537,51 @@ class TestBackpressureController:
         assert len(errors) == 0
         assert controller.is_closed is True
 
+    def test_pending_reads_do_not_take_lock(self):
+        """get_pending_jobs()/get_pending_mb() don't block while a writer holds the lock."""
+        controller = BackpressureController(max_jobs=10, max_mb=500.0)
+        controller.job_dispatched(1024 * 1024)
+
+        result = []
+
+        def reader():
+            result.append((controller.get_pending_jobs(), controller.get_pending_mb()))
+
+        with controller._pending_jobs.get_lock(), controller._pending_bytes.get_lock():
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(timeout=1.0)
+            assert not thread.is_alive(), "Reads should not wait for the counter lock"
+
+        assert result == [(1, 1.0)]
+        controller.close()
+
+    def test_should_throttle_skips_lock_well_below_limits(self):
+        """should_throttle() answers without the lock when far below both limits."""
+        controller = BackpressureController(max_jobs=10, max_mb=500.0)
+        controller.job_dispatched(1024 * 1024)
+
+        result = []
+        with controller._pending_jobs.get_lock():
+            thread = threading.Thread(target=lambda: result.append(controller.should_throttle()))
+            thread.start()
+            thread.join(timeout=1.0)
+            assert not thread.is_alive(), "Fast path should not wait for the counter lock"
+
+        assert result == [False]
+        controller.close()
+
+    def test_should_throttle_near_limit_uses_exact_check(self):
+        """Between half the limit and the limit, should_throttle() still returns False."""
+        controller = BackpressureController(max_jobs=4, max_mb=500.0)
+        for _ in range(3):
+            controller.job_dispatched(1000)
+
+        assert controller.should_throttle() is False
+        controller.job_dispatched(1000)
+        assert controller.should_throttle() is True
+        controller.close()
+
     def test_close_wakes_blocked_wait_for_capacity(self):
         """close() wakes threads blocked in wait_for_capacity()."""
         controller = BackpressureController(max_jobs=1, max_mb=500.0, timeout_s=30.0)
@@ -483,6 +608,49 @@ class TestBackpressureController:
         assert result[0] is True  # closed controller returns True
         assert elapsed[0] < 5.0  # Should not have waited full 30s timeout
 
+    def test_close_releases_counters_before_waking_waiter(self):
+        """A waiter woken by close() must not see the old, still-throttled counters."""
+        controller = BackpressureController(max_jobs=1, max_mb=500.0, timeout_s=30.0)
+        controller.job_dispatched(1000)
+        controller.job_dispatched(1000)  # Exceed limit; counters stay over it through close()
+
+        throttled_when_woken = []
+        inner_event = threading.Event()
+
+        class RecordingEvent:
+            def set(self):
+                # What a waiter would observe at the instant it is woken
+                throttled_when_woken.append(controller.should_throttle())
+                inner_event.set()
+
+            def clear(self):
+                inner_event.clear()
+
+            def wait(self, timeout=None):
+                return inner_event.wait(timeout)
+
+        controller._capacity_event = RecordingEvent()
+
+        result = [None]
+        elapsed = [None]
+
+        def wait_worker():
+            start = time.time()
+            result[0] = controller.wait_for_capacity()
+            elapsed[0] = time.time() - start
+
+        thread = threading.Thread(target=wait_worker)
+        thread.start()
+        time.sleep(0.2)  # Let thread start waiting
+
+        controller.close()
+        thread.join(timeout=2.0)
+
+        assert throttled_when_woken == [False]
+        assert not thread.is_alive(), "Thread should have been released promptly by close()"
+        assert result[0] is True
+        assert elapsed[0] < 2.0
+
 
 def _create_runner_with_backpressure(controller: BackpressureController) -> JobRunner:
     """Create a JobRunner connected to a BackpressureController."""
@@ -496,6 +664,17 @@ def _create_runner_with_backpressure(controller: BackpressureController) -> JobR
 class TestJobRunnerBackpressureTracking:
     """Tests for JobRunner backpressure tracking integration."""
 
+    def test_pending_count_shares_backpressure_lock(self):
+        """JobRunner's own pending counter uses the backpressure lock when one is provided."""
+        controller = BackpressureController(max_jobs=100, max_mb=1000.0)
+        runner = _create_runner_with_backpressure(controller)
+
+        assert runner._pending_count.get_lock() is controller.pending_jobs_value.get_lock()
+
+        plain_runner = JobRunner()
+        assert plain_runner._pending_count.get_lock() is not controller.pending_jobs_value.get_lock()
+        controller.close()
+
     def test_dispatch_increments_backpressure_counters(self):
         """dispatch() increments both pending_jobs and pending_bytes."""
         controller = BackpressureController(max_jobs=100, max_mb=1000.0)
@@ -1,11 +1,19 @@
+import math
+
+import pytest
+
+import control._def
 import tests.control.gui_test_stubs as gts
 import squid.stage
 from control.core.scan_coordinates import (
     ScanCoordinates,
+    ScanCoordinatesSiLA2,
     ScanCoordinatesUpdate,
     AddScanCoordinateRegion,
     RemovedScanCoordinateRegion,
     ClearedScanCoordinates,
+    _index_to_row,
+    _row_to_index,
 )
 from control.microscope import Microscope
 
@@ -102,3 +110,91 @@ def test_sort_coordinates_manual_regions_preserve_drawing_order():
     keys = list(sc.region_centers.keys())
     # Manual regions first (drawing order), then wells (S-Pattern: row B reversed)
     assert keys == ["manual0", "manual1", "A1", "A2", "B2", "B1"]
+
+
+def test_sila2_selected_well_range_snakes_from_start_row():
+    """Well ranges are laid out row by row, reversing column order on alternate rows."""
+    scope = Microscope.build_from_global_config(simulated=True)
+    sc = ScanCoordinatesSiLA2(scope.objective_store, scope.stage, scope.camera, update_callback=lambda update: None)
+    wellplate_settings = {"a1_x_mm": 10.0, "a1_y_mm": 20.0, "well_spacing_mm": 4.5}
+
+    sc.get_selected_well_coordinates("A1:C3", wellplate_settings)
+
+    assert list(sc.region_centers) == ["A1", "A2", "A3", "B3", "B2", "B1", "C1", "C2", "C3"]
+    x_b2, y_b2 = sc.region_centers["B2"]
+    assert x_b2 == 10.0 + 4.5 + control._def.WELLPLATE_OFFSET_X_mm
+    assert y_b2 == 20.0 + 4.5 + control._def.WELLPLATE_OFFSET_Y_mm
+
+
+def test_row_name_index_round_trip():
+    assert _index_to_row(0) == "A"
+    assert _index_to_row(25) == "Z"
+    assert _index_to_row(26) == "AA"
+    assert _row_to_index("aa") == 26
+    for index in range(800):
+        assert _row_to_index(_index_to_row(index)) == index
+
+
+def test_sila2_circle_region_keeps_fovs_inside_well():
+    scope = Microscope.build_from_global_config(simulated=True)
+    sc = ScanCoordinatesSiLA2(scope.objective_store, scope.stage, scope.camera, update_callback=lambda update: None)
+    fov_half = scope.camera.get_fov_size_mm() / 2
+    scan_size_mm = 8 * fov_half
+
+    coords = sc.create_region_coordinates(10.0, 20.0, scan_size_mm, overlap_percent=10, shape="Circle")
+    square = sc.create_region_coordinates(10.0, 20.0, scan_size_mm, overlap_percent=10, shape="Square")
+
+    assert 0 < len(coords) < len(square)
+    for x, y in coords:
+        assert (abs(x - 10.0) + fov_half) ** 2 + (abs(y - 20.0) + fov_half) ** 2 <= (scan_size_mm / 2) ** 2 + 1e-9
+
+
+def test_sila2_alternate_wells_continue_from_previous_well(monkeypatch):
+    """With S-Pattern, each well's scan starts beside where the previous well's scan ended."""
+    monkeypatch.setattr(control._def, "FOV_PATTERN", "S-Pattern")
+    scope = Microscope.build_from_global_config(simulated=True)
+    sc = ScanCoordinatesSiLA2(scope.objective_store, scope.stage, scope.camera, update_callback=lambda update: None)
+    well_size_mm = 6 * scope.camera.get_fov_size_mm()
+
+    sc.get_scan_coordinates_from_selected_wells("384 well plate", "A1:A3", scan_size_mm=well_size_mm)
+
+    spacing_mm = control._def.get_wellplate_settings("384 well plate")["well_spacing_mm"]
+    wells = [sc.region_fov_coordinates[k] for k in ("A1", "A2", "A3")]
+    for previous, current in zip(wells, wells[1:]):
+        assert current[0][0] - previous[-1][0] == pytest.approx(spacing_mm)
+        assert current[0][1] == pytest.approx(previous[-1][1])
+
+
+def _sila2_s_pattern_well_scan(monkeypatch, well_names, grid_steps):
+    """Scan well_names on a 384 well plate with a grid_steps x grid_steps S-pattern per well."""
+    monkeypatch.setattr(control._def, "FOV_PATTERN", "S-Pattern")
+    scope = Microscope.build_from_global_config(simulated=True)
+    monkeypatch.setattr(scope.camera, "get_fov_size_mm", lambda: 1.0)
+    sc = ScanCoordinatesSiLA2(scope.objective_store, scope.stage, scope.camera, update_callback=lambda update: None)
+    sc.get_scan_coordinates_from_selected_wells("384 well plate", well_names, scan_size_mm=float(grid_steps))
+    return [sc.region_fov_coordinates[k] for k in sc.region_centers]
+
+
+@pytest.mark.parametrize(
+    "well_names,grid_steps",
+    [
+        ("A1:C1", 3),  # vertical range
+        ("A1:C1", 4),
+        ("A1:A4", 3),  # single row, odd grid
+        ("A1:B3", 3),  # multiple rows, odd width
+    ],
+)
+def test_sila2_wells_start_at_corner_nearest_previous_end(monkeypatch, well_names, grid_steps):
+    """Each well's scan starts at the grid corner adjacent to the previous well's last FOV."""
+    wells = _sila2_s_pattern_well_scan(monkeypatch, well_names, grid_steps)
+
+    step_mm = 0.9  # 1 mm FOV at 10% overlap
+    spacing_mm = control._def.get_wellplate_settings("384 well plate")["well_spacing_mm"]
+    for previous, current in zip(wells, wells[1:]):
+        assert len(current) == grid_steps * grid_steps
+        # Adjacent wells are one well spacing apart, so the closest corners are one spacing minus the grid extent
+        jump_mm = math.hypot(current[0][0] - previous[-1][0], current[0][1] - previous[-1][1])
+        assert jump_mm == pytest.approx(spacing_mm - (grid_steps - 1) * step_mm)
+        # Re-orienting a well keeps it a serpentine: consecutive FOVs are always one step apart
+        for (x0, y0), (x1, y1) in zip(current, current[1:]):
+            assert math.hypot(x1 - x0, y1 - y0) == pytest.approx(step_mm)
@@ -1,3 +1,4 @@
+import os
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -179,3 +180,24 @@ class TestGetImagePixelSizeUm:
                 assert scope.get_image_pixel_size_um() is None
         finally:
             scope.close()
+
+
+class TestAcquireSingleFov:
+    """Tests for Microscope.acquire_single_fov()."""
+
+    def test_saves_every_frame_in_acquisition_order(self, tmp_path):
+        scope = control.microscope.Microscope.build_from_global_config(True)
+        try:
+            channels = {name: MagicMock() for name in ("BF LED", "Fluorescence 488")}
+            for name, channel in channels.items():
+                channel.name = name
+            nz = control.microscope._MAX_PENDING_SAVES + 1
+            with patch.object(scope, "_get_channel_or_raise", side_effect=lambda _, name: channels[name]):
+                with patch.object(scope.live_controller, "set_microscope_mode"):
+                    saved = scope.acquire_single_fov(list(channels), str(tmp_path), NZ=nz, deltaZ_mm=0.001)
+
+            expected_ids = [f"0_0_{z}_{name.replace(' ', '_')}" for z in range(nz) for name in channels]
+            assert [os.path.splitext(os.path.basename(p))[0] for p in saved] == expected_ids
+            assert all(os.path.exists(p) for p in saved)
+        finally:
+            scope.close()
@@ -0,0 +1,317 @@
+"""Tests for the Workflow Runner dialog and its table model."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+from qtpy.QtCore import Qt
+from qtpy.QtWidgets import QDialog, QFileDialog, QMessageBox
+
+from control.widgets_workflow import _FILE_DIALOG_OPTIONS, WorkflowRunnerDialog, WorkflowTableModel
+from control.workflow_runner import SequenceItem, SequenceType, Workflow
+
+
+def _script(name="Fluidics", **kwargs):
+    return SequenceItem(name=name, sequence_type=SequenceType.SCRIPT, script_path="/scripts/run.py", **kwargs)
+
+
+@pytest.fixture
+def workflow():
+    """Acquisition followed by one script sequence."""
+    wf = Workflow.create_default()
+    wf.sequences.append(_script())
+    return wf
+
+
+@pytest.fixture
+def model(workflow):
+    return WorkflowTableModel(workflow)
+
+
+@pytest.fixture
+def dialog(qtbot):
+    dlg = WorkflowRunnerDialog()
+    qtbot.addWidget(dlg)
+    return dlg
+
+
+def test_file_dialogs_force_qt_dialog_only_on_linux():
+    """The non-native dialog works around Linux portal stalls; other platforms keep their native picker."""
+    uses_qt_dialog = bool(_FILE_DIALOG_OPTIONS & QFileDialog.DontUseNativeDialog)
+    assert uses_qt_dialog == sys.platform.startswith("linux")
+
+
+class TestWorkflowTableModel:
+    """Tests for WorkflowTableModel."""
+
+    def test_rows_mirror_workflow_sequences(self, model, workflow):
+        assert model.rowCount() == len(workflow.sequences) == 2
+        assert model.columnCount() == len(WorkflowTableModel.HEADERS)
+        assert model.data(model.index(1, WorkflowTableModel.COL_NAME)) == "Fluidics"
+        assert model.data(model.index(1, WorkflowTableModel.COL_COMMAND)) == "/scripts/run.py"
+
+    @pytest.mark.parametrize("checked", [Qt.Checked, int(Qt.Checked)], ids=["enum", "int"])
+    def test_toggle_include_checkbox(self, model, workflow, checked):
+        """Unchecking and re-checking writes through, whether the binding passes an int or a CheckState."""
+        index = model.index(1, WorkflowTableModel.COL_INCLUDE)
+
+        assert model.setData(index, Qt.Unchecked, Qt.CheckStateRole)
+        assert workflow.sequences[1].included is False
+        assert model.data(index, Qt.CheckStateRole) == Qt.Unchecked
+
+        assert model.setData(index, checked, Qt.CheckStateRole)
+        assert workflow.sequences[1].included is True
+        assert model.data(index, Qt.CheckStateRole) == Qt.Checked
+
+    def test_name_edit_writes_through(self, model, workflow):
+        assert model.setData(model.index(1, WorkflowTableModel.COL_NAME), "  Wash  ")
+        assert workflow.sequences[1].name == "Wash"
+
+    @pytest.mark.parametrize("name", ["", "   ", "Acquisition", "ACQUISITION"])
+    def test_name_edit_rejects_empty_and_reserved(self, model, workflow, name):
+        assert model.setData(model.index(1, WorkflowTableModel.COL_NAME), name) is False
+        assert workflow.sequences[1].name == "Fluidics"
+
+    def test_cycle_arg_edits_write_through(self, model, workflow):
+        assert model.setData(model.index(1, WorkflowTableModel.COL_CYCLE_ARG), "port")
+        assert model.setData(model.index(1, WorkflowTableModel.COL_CYCLE_VALUES), "1,2,3")
+        assert workflow.sequences[1].cycle_arg_name == "port"
+        assert workflow.sequences[1].cycle_arg_values == "1,2,3"
+
+        assert model.setData(model.index(1, WorkflowTableModel.COL_CYCLE_ARG), " ")
+        assert workflow.sequences[1].cycle_arg_name is None
+
+    def test_acquisition_row_is_not_editable(self, model, workflow):
+        for col in (
+            WorkflowTableModel.COL_NAME,
+            WorkflowTableModel.COL_COMMAND,
+            WorkflowTableModel.COL_CYCLE_ARG,
+            WorkflowTableModel.COL_CYCLE_VALUES,
+        ):
+            index = model.index(0, col)
+            assert not model.flags(index) & Qt.ItemIsEditable
+            assert model.setData(index, "Renamed") is False
+        assert workflow.sequences[0].name == "Acquisition"
+        # Acquisitions can still be excluded from a run
+        assert model.flags(model.index(0, WorkflowTableModel.COL_INCLUDE)) & Qt.ItemIsUserCheckable
+
+    def test_command_column_is_read_only_for_scripts(self, model):
+        assert not model.flags(model.index(1, WorkflowTableModel.COL_COMMAND)) & Qt.ItemIsEditable
+
+    def test_set_editable_false_blocks_all_edits(self, model, workflow):
+        model.set_editable(False)
+
+        for col in range(model.columnCount()):
+            assert not model.flags(model.index(1, col)) & (Qt.ItemIsEditable | Qt.ItemIsUserCheckable)
+        assert model.setData(model.index(1, WorkflowTableModel.COL_NAME), "Wash") is False
+        assert model.setData(model.index(1, WorkflowTableModel.COL_INCLUDE), Qt.Unchecked, Qt.CheckStateRole) is False
+        assert workflow.sequences[1].name == "Fluidics"
+        assert workflow.sequences[1].included is True
+
+        model.set_editable(True)
+        assert model.setData(model.index(1, WorkflowTableModel.COL_NAME), "Wash")
+
+    def test_set_current_row_highlights_row(self, qtbot, model):
+        name_index = model.index(1, WorkflowTableModel.COL_NAME)
+        assert model.data(name_index, Qt.BackgroundRole) is None
+
+        with qtbot.waitSignal(model.dataChanged):
+            model.set_current_row(1)
+        assert model.data(name_index, Qt.BackgroundRole) == WorkflowTableModel.COLOR_RUNNING_BG
+        # The running highlight takes precedence over the acquisition row color
+        model.set_current_row(0)
+        assert model.data(model.index(0, 0), Qt.BackgroundRole) == WorkflowTableModel.COLOR_RUNNING_BG
+        assert model.data(name_index, Qt.BackgroundRole) is None
+
+        model.set_current_row(-1)
+        assert model.data(model.index(0, 0), Qt.BackgroundRole) == WorkflowTableModel.COLOR_ACQUISITION_BG
+
+    def test_insert_and_remove_sequence(self, qtbot, model, workflow):
+        with qtbot.waitSignal(model.rowsInserted):
+            model.insert_sequence(1, _script("Wash"))
+        assert [s.name for s in workflow.sequences] == ["Acquisition", "Wash", "Fluidics"]
+        assert model.rowCount() == 3
+
+        with qtbot.waitSignal(model.rowsRemoved):
+            model.remove_sequence(0)
+        assert [s.name for s in workflow.sequences] == ["Wash", "Fluidics"]
+        assert model.rowCount() == 2
+
+
+class TestWorkflowRunnerDialogTable:
+    """Tests for insert, edit and remove going through the dialog's model."""
+
+    def test_insert_below_selection(self, dialog):
+        dialog.table.selectRow(0)
+        with patch.object(dialog, "_create_sequence_from_dialog", return_value=_script("Wash")):
+            dialog._insert_sequence(above=False, sequence_type="script")
+
+        assert [s.name for s in dialog._workflow.sequences] == ["Acquisition", "Wash"]
+        assert dialog._model.rowCount() == 2
+        assert dialog.table.currentIndex().row() == 1
+
+    def test_edit_updates_sequence_and_view(self, qtbot, dialog):
+        dialog._model.insert_sequence(1, _script("Wash"))
+        dialog.table.selectRow(1)
+        edit_dialog = dialog._get_sequence_dialog(is_acquisition=False)
+        edit_data = {"name": "Rinse", "script_path": "/scripts/rinse.py", "arguments": None}
+
+        with patch.object(edit_dialog, "exec_", return_value=QDialog.Accepted), patch.object(
+            edit_dialog, "get_sequence_data", return_value={**edit_data, "python_path": None, "conda_env": None}
+        ):
+            with qtbot.waitSignal(dialog._model.dataChanged):
+                dialog._edit_sequence()
+
+        assert dialog._workflow.sequences[1].script_path == "/scripts/rinse.py"
+        assert dialog._model.data(dialog._model.index(1, WorkflowTableModel.COL_NAME)) == "Rinse"
+
+    def test_remove_selected_sequence(self, dialog):
+        dialog._model.insert_sequence(1, _script("Wash"))
+        dialog.table.selectRow(1)
+        with patch.object(QMessageBox, "question", return_value=QMessageBox.Yes):
+            dialog._remove_sequence()
+
+        assert [s.name for s in dialog._workflow.sequences] == ["Acquisition"]
+        assert dialog._model.rowCount() == 1
+
+    def test_highlight_sequence_uses_model(self, dialog):
+        dialog.highlight_sequence(0)
+        assert dialog._model.data(dialog._model.index(0, 0), Qt.BackgroundRole) == WorkflowTableModel.COLOR_RUNNING_BG
+        dialog.clear_highlight()
+        assert dialog._model.data(dialog._model.index(0, 0), Qt.BackgroundRole) == (
+            WorkflowTableModel.COLOR_ACQUISITION_BG
+        )
+
+    def test_table_is_read_only_while_running(self, dialog):
+        dialog._model.insert_sequence(1, _script("Wash"))
+        dialog.set_running_state(True)
+
+        assert dialog._model.setData(dialog._model.index(1, WorkflowTableModel.COL_NAME), "Rinse") is False
+        assert dialog._workflow.sequences[1].name == "Wash"
+        dialog.set_running_state(False)  # closing a running dialog would prompt to stop the workflow
+
+
+class TestWorkflowRunnerDialogOutput:
+    """Tests for buffered script output."""
+
+    def test_output_lines_appear_after_flush_timer(self, qtbot, dialog):
+        dialog.on_script_output("first")
+        dialog.on_script_output("<b>second</b>")
+
+        # Nothing is appended until the flush timer fires
+        assert dialog.text_output.toPlainText() == ""
+        assert dialog._output_flush_timer.isActive()
+
+        qtbot.waitUntil(lambda: dialog.text_output.toPlainText() == "first\n<b>second</b>", timeout=1000)
+        assert dialog._pending_output == []
+
+    def test_finishing_workflow_flushes_pending_output(self, dialog):
+        dialog.set_running_state(True)
+        dialog.on_script_output("last line")
+
+        dialog.on_workflow_finished(True)
+
+        assert dialog.text_output.toPlainText() == "last line"
+        assert not dialog._output_flush_timer.isActive()
+
+    def test_closing_dialog_flushes_pending_output(self, dialog):
+        dialog.show()
+        dialog.on_script_output("last line")
+
+        dialog.close()
+
+        assert dialog.text_output.toPlainText() == "last line"
+
+    def test_starting_run_drops_stale_output(self, qtbot, dialog):
+        dialog.on_script_output("stale")
+        dialog.set_running_state(True)
+        dialog._flush_output()
+
+        assert dialog.text_output.toPlainText() == ""
+        dialog.set_running_state(False)
+
+
+class TestWorkflowRunnerDialogRunningState:
+    """Tests for set_running_state."""
+
+    def test_state_change_toggles_controls_and_model(self, dialog):
+        with patch.object(dialog._model, "set_editable", wraps=dialog._model.set_editable) as set_editable:
+            dialog.set_running_state(True)
+
+            assert not any(widget.isEnabled() for widget in dialog._editing_widgets)
+            assert dialog.btn_pause.isEnabled() and dialog.btn_stop.isEnabled()
+            set_editable.assert_called_once_with(False)
+
+            dialog.set_running_state(False)
+
+            assert all(widget.isEnabled() for widget in dialog._editing_widgets)
+            assert not dialog.btn_pause.isEnabled() and not dialog.btn_stop.isEnabled()
+            assert set_editable.call_args_list[-1].args == (True,)
+
+    def test_repeating_same_state_is_noop(self, dialog):
+        dialog.set_running_state(True)
+        dialog.on_workflow_paused()
+        dialog.text_output.appendPlainText("output so far")
+
+        with patch.object(dialog._model, "set_editable") as set_editable:
+            dialog.set_running_state(True)
+
+        set_editable.assert_not_called()
+        # A repeated call must not clear the log or reset the pause state
+        assert dialog.text_output.toPlainText() == "output so far"
+        assert dialog.btn_pause.text() == "Resume"
+        assert dialog._is_paused is True
+        dialog.set_running_state(False)
+
+
+class TestSequenceDialogReuse:
+    """Tests for the shared add/edit dialogs."""
+
+    def test_reused_script_dialog_is_cleared_after_cancelled_edit(self, dialog):
+        dialog._model.insert_sequence(1, _script("Wash", arguments="--cycles 3", conda_env="fluidics"))
+        dialog.table.selectRow(1)
+        seq_dialog = dialog._get_sequence_dialog(is_acquisition=False)
+
+        def edit_then_cancel():
+            assert seq_dialog.windowTitle() == "Edit Sequence"
+            assert seq_dialog.edit_name.text() == "Wash"
+            seq_dialog.edit_python_path.setText("/usr/bin/python3")
+            return QDialog.Rejected
+
+        with patch.object(seq_dialog, "exec_", side_effect=edit_then_cancel):
+            dialog._edit_sequence()
+        assert dialog._workflow.sequences[1].python_path is None
+
+        reopened = dialog._get_sequence_dialog(is_acquisition=False)
+
+        assert reopened is seq_dialog
+        assert reopened.windowTitle() == "Add Sequence"
+        assert reopened.btn_add.text() == "Add"
+        for field in (
+            reopened.edit_name,
+            reopened.edit_script_path,
+            reopened.edit_arguments,
+            reopened.edit_python_path,
+            reopened.edit_conda_env,
+        ):
+            assert field.text() == ""
+
+    def test_reused_acquisition_dialog_is_cleared_after_cancelled_edit(self, dialog):
+        dialog._workflow.sequences[0].config_path = "/configs/scan.yaml"
+        dialog.table.selectRow(0)
+        acq_dialog = dialog._get_sequence_dialog(is_acquisition=True)
+
+        def edit_then_cancel():
+            assert acq_dialog.edit_config_path.text() == "/configs/scan.yaml"
+            acq_dialog.edit_name.setText("Pre-scan")
+            return QDialog.Rejected
+
+        with patch.object(acq_dialog, "exec_", side_effect=edit_then_cancel):
+            dialog._edit_sequence()
+
+        reopened = dialog._get_sequence_dialog(is_acquisition=True)
+
+        assert reopened is acq_dialog
+        assert reopened.windowTitle() == "Add Acquisition"
+        assert reopened.edit_name.text() == "Acquisition"
+        assert reopened.edit_config_path.text() == ""